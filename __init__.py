@@ -15,9 +15,14 @@ import logging
 import zipfile
 import traceback
 import os.path as path
-from imp import reload
 from collections import OrderedDict
 
+# Py2, Py3 compatibility (imp is deprecated in Py3, Py2 has reload as a builtin)
+try:
+    from importlib import reload
+except ImportError:
+    pass
+
 from .settings import PDXsettings
 
 
@@ -939,7 +939,7 @@ def create_skin(PDX_skin, PDX_bones, obj, rig, max_infs=None):
     num_infs = PDX_skin.bones[0]
     armt_bones = rig.data.bones
 
-    for vtx in range(0, int(len(PDX_skin.ix) / max_infs)):
+    for vtx in range(0, len(PDX_skin.ix) // max_infs):
         skin_dict[vtx] = dict(joints=[], weights=[])
 
     # gather joint index and weighting that each vertex is skinned to
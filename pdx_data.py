@@ -12,7 +12,10 @@ from __future__ import print_function, unicode_literals
 
 import os
 import sys
-from struct import pack, unpack_from
+import mmap
+from array import array
+from contextlib import closing
+from struct import Struct
 
 try:
     import xml.etree.cElementTree as Xml
@@ -27,6 +30,38 @@ except NameError:
     PY3 = True
     basestring = str
 
+# Py2 has no atomic replace, remove the old file first
+try:
+    from os import replace as replace_file
+except ImportError:
+
+    def replace_file(src, dst):
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+# Py2 array typecodes must be native strings and arrays convert with 'fromstring/tostring' not 'frombytes/tobytes'
+_ARRAY_INT = str("i")
+_ARRAY_FLOAT = str("f")
+_array_frombytes = array.frombytes if PY3 else array.fromstring
+_array_tobytes = array.tobytes if PY3 else array.tostring
+
+# file data types, by array typecode
+_ARRAY_DATATYPES = {_ARRAY_INT: "i", _ARRAY_FLOAT: "f"}
+
+
+""" ====================================================================================================================
+    Variables.
+========================================================================================================================
+"""
+
+# precompiled binary formats, these are reused for every read and write so only parse each format string once
+_S_BYTE = Struct("<b")
+_S_CHAR = Struct("<c")
+_S_INT = Struct("<i")
+_S_STR_HEADER = Struct("<2i")
+_S_PAD = Struct("<x")
+
 
 """ ====================================================================================================================
     PDX data classes.
@@ -41,32 +76,46 @@ class PDXData(object):
     """
 
     def __init__(self, element, depth=None):
-        # use element tag as object name
-        setattr(self, "name", element.tag)
-
-        # object depth in hierarchy
-        self.depth = depth or 0
-
-        # object attribute collection
-        self.attrlist = []
-
-        # set XML element attributes as object attributes
-        for attr in element.attrib:
-            setattr(self, attr, element.attrib[attr])
-            self.attrlist.append(attr)
-
-        # iterate over XML element children, set these as attributes, nesting further PDXData objects
-        for child in list(element):
-            child_data = type(self)(child, self.depth + 1)
-            if hasattr(self, child.tag):
-                curr_data = getattr(self, child.tag)
-                if type(curr_data) == list:
-                    curr_data.append(child_data)
+        # walk the XML hierarchy with an explicit stack, rather than recursing through __init__ once per child element
+        cls = type(self)
+        stack = [(self, element, depth or 0)]
+
+        while stack:
+            pdx_obj, pdx_element, pdx_depth = stack.pop()
+
+            # use element tag as object name
+            setattr(pdx_obj, "name", pdx_element.tag)
+
+            # object depth in hierarchy
+            pdx_obj.depth = pdx_depth
+
+            # object attribute collection, and the type of data held by each XML attribute
+            pdx_obj.attrlist = []
+            pdx_obj.attrtypes = {}
+
+            # set XML element attributes as object attributes
+            for attr in pdx_element.attrib:
+                attr_values = pdx_element.attrib[attr]
+                setattr(pdx_obj, attr, attr_values)
+                pdx_obj.attrlist.append(attr)
+                # data is homogeneous, so the first value tells us the type of the whole array
+                pdx_obj.attrtypes[attr] = type(attr_values[0]) if len(attr_values) else None
+
+            # iterate over XML element children, set these as attributes, nesting further PDXData objects
+            for child in pdx_element:
+                # child objects are attached here in order, but only populated once they come off the stack
+                child_data = cls.__new__(cls)
+                stack.append((child_data, child, pdx_depth + 1))
+
+                if hasattr(pdx_obj, child.tag):
+                    curr_data = getattr(pdx_obj, child.tag)
+                    if type(curr_data) == list:
+                        curr_data.append(child_data)
+                    else:
+                        setattr(pdx_obj, child.tag, [curr_data, child_data])
                 else:
-                    setattr(self, child.tag, [curr_data, child_data])
-            else:
-                setattr(self, child.tag, child_data)
-                self.attrlist.append(child.tag)
+                    setattr(pdx_obj, child.tag, child_data)
+                    pdx_obj.attrlist.append(child.tag)
 
     def __str__(self):
         indent = " " * 4
@@ -79,15 +128,20 @@ class PDXData(object):
                 string.append("{}{}:".format(self.depth * indent, _key))
                 string.append("{}".format(_val))
 
+            elif _key in self.attrtypes:
+                # skip empty data
+                if self.attrtypes[_key] is None:
+                    continue
+                data_len = len(_val)
+                data_type = self.attrtypes[_key].__name__
+                if isinstance(_val, array):
+                    _val = _val.tolist()
+                string.append("{}{} ({}, {}):  {}".format(self.depth * indent, _key, data_type, data_len, _val))
+
             else:
-                if all(type(v) == type(self) for v in _val):
-                    for v in _val:
-                        string.append("{}{}:".format(self.depth * indent, _key))
-                        string.append("{}".format(v))
-                else:
-                    data_len = len(_val)
-                    data_type = list(set(type(v) for v in _val))[0].__name__
-                    string.append("{}{} ({}, {}):  {}".format(self.depth * indent, _key, data_type, data_len, _val))
+                for v in _val:
+                    string.append("{}{}:".format(self.depth * indent, _key))
+                    string.append("{}".format(v))
 
         return "\n".join(string)
 
@@ -103,7 +157,7 @@ def parseProperty(bdata, pos):
     pos += 1
 
     # get length of property name
-    prop_name_length = unpack_from("b", bdata, offset=pos)[0]
+    prop_name_length = _S_BYTE.unpack_from(bdata, pos)[0]
     pos += 1
 
     # get property name as string
@@ -111,7 +165,10 @@ def parseProperty(bdata, pos):
     pos += prop_name_length
 
     # get property data
-    prop_values, pos = parseData(bdata, pos)
+    try:
+        prop_values, pos = parseData(bdata, pos)
+    except NotImplementedError as err:
+        raise NotImplementedError("Failed reading property: {}. {}".format(prop_name, err))
 
     return prop_name, prop_values, pos
 
@@ -119,82 +176,100 @@ def parseProperty(bdata, pos):
 def parseObject(bdata, pos):
     # skip and record any repeated '[' characters
     objdepth = 0
-    while unpack_from("c", bdata, offset=pos)[0].decode() == "[":
+    while bdata[pos : pos + 1] == b"[":  # slice rather than index, so we compare bytes in both Py2 and Py3
         objdepth += 1
         pos += 1
 
     # get object name as string
-    obj_name = ""
     # we don't know the string length, so look for an ending byte of zero
-    while unpack_from("b", bdata, offset=pos)[0] != 0:
-        obj_name += unpack_from("c", bdata, offset=pos)[0].decode("latin-1")
-        pos += 1
+    name_end = bdata.find(b"\x00", pos)
+    if name_end == -1:
+        raise NotImplementedError("Unterminated object name encountered at position {}".format(pos))
+    obj_name = bdata[pos:name_end].decode("latin-1")
 
     # skip the ending zero byte
-    pos += 1
+    pos = name_end + 1
 
     return obj_name, objdepth, pos
 
 
 def parseString(bdata, pos, length):
-    val_tuple = unpack_from("c" * length, bdata, offset=pos)  # TODO: should fmt here be "s" * length ?
+    # check if the ending byte is zero and exclude it if so, testing the raw byte before we decode anything
+    if length and bdata[pos + length - 1 : pos + length] == b"\x00":
+        length -= 1
+
+    # decode the whole slice of bytes in one go
+    return bdata[pos : pos + length].decode("latin-1")
+
+
+def parseArray(bdata, pos, typecode, count):
+    # a negative count would move the read position backwards, re-reading the same data
+    if count < 0:
+        raise NotImplementedError("Negative array count {} encountered at position {}".format(count, pos))
+
+    # a short slice would silently give fewer values than the file declares, so check the data is all there first
+    end = pos + 4 * count
+    if end > len(bdata):
+        raise NotImplementedError(
+            "Truncated array data encountered at position {}, expected {} values but only {} bytes remain".format(
+                pos, count, len(bdata) - pos
+            )
+        )
 
-    # turn the resulting tuple into a string of bytes
-    string = b"".join(val_tuple).decode("latin-1")
+    # copy the raw bytes straight into a typed array, all values in the file are 4 bytes wide
+    values = array(typecode)
+    _array_frombytes(values, bdata[pos:end])
 
-    # check if the ending byte is zero and remove if so
-    if string[-1] == chr(0):
-        string = string[:-1]
+    # file data is little-endian
+    if sys.byteorder != "little":
+        values.byteswap()
 
-    return string
+    return values
 
 
 def parseData(bdata, pos):
-    # determine the  data type
-    datatype = unpack_from("c", bdata, offset=pos)[0].decode()
-    # TODO: use an array here instead of list for memory efficiency?
+    # determine the data type, comparing the raw byte rather than unpacking and decoding it
+    datatype = bdata[pos : pos + 1]
     datavalues = []
 
-    if datatype == "i":
+    if datatype == b"i":
         # handle integer data
         pos += 1
 
         # count
-        size = unpack_from("i", bdata, offset=pos)[0]
+        size = _S_INT.unpack_from(bdata, pos)[0]
         pos += 4
 
         # values
-        for i in range(0, size):
-            val = unpack_from("i", bdata, offset=pos)[0]
-            datavalues.append(val)
-            pos += 4
+        datavalues = parseArray(bdata, pos, _ARRAY_INT, size)
+        pos += 4 * size
 
-    elif datatype == "f":
+    elif datatype == b"f":
         # handle float data
         pos += 1
 
         # count
-        size = unpack_from("i", bdata, offset=pos)[0]
+        size = _S_INT.unpack_from(bdata, pos)[0]
         pos += 4
 
         # values
-        for i in range(0, size):
-            val = unpack_from("f", bdata, offset=pos)[0]
-            datavalues.append(val)
-            pos += 4
+        datavalues = parseArray(bdata, pos, _ARRAY_FLOAT, size)
+        pos += 4 * size
 
-    elif datatype == "s":
+    elif datatype == b"s":
         # handle string data
         pos += 1
 
-        # count
-        size = unpack_from("i", bdata, offset=pos)[0]
+        # count and string length, read together
+        size, str_data_length = _S_STR_HEADER.unpack_from(bdata, pos)
         # TODO: we are assuming that we always have a count of 1 string, not an array of multiple strings
-        pos += 4
+        pos += 8
 
-        # string length
-        str_data_length = unpack_from("i", bdata, offset=pos)[0]
-        pos += 4
+        # check the string length the same way as array counts, so corrupt data fails here rather than misreading
+        if str_data_length < 0 or pos + str_data_length > len(bdata):
+            raise NotImplementedError(
+                "Invalid string length {} encountered at position {}".format(str_data_length, pos)
+            )
 
         # value
         val = parseString(bdata, pos, str_data_length)
@@ -203,7 +278,9 @@ def parseData(bdata, pos):
 
     else:
         raise NotImplementedError(
-            "Unknown data type encountered. {} at position {}\n{}".format(datatype, pos, bdata[pos - 10 : pos + 10])
+            "Unknown data type encountered. {} at position {}\n{}".format(
+                datatype.decode("latin-1"), pos, bdata[pos - 10 : pos + 10]
+            )
         )
 
     return datavalues, pos
@@ -212,65 +289,75 @@ def parseData(bdata, pos):
 def read_meshfile(filepath):
     """
         Reads through a .mesh file and gathers all the data into hierarchical element structure.
-        The resulting XML is not natively writable to string as it contains Python data types.
+        The resulting XML is not natively writable to string as it contains Python data types. Integer and float
+        properties are stored as typed arrays, string properties as a list of strings.
     """
-    # read the data
-    with open(filepath, "rb") as fp:
-        fdata = fp.read()
-
     # create an XML structure to store the object hierarchy
     file_element = Xml.Element("File")
     file_element.attrib = dict(name=os.path.split(filepath)[1], path=os.path.split(filepath)[0])
 
-    # determine the file length and set initial file read position
-    eof = len(fdata)
-    pos = 0
-
-    # read the file header '@@b@'
-    header = unpack_from("c" * 4, fdata, pos)
-    if bytes(b"".join(header)) == b"@@b@":
-        pos = 4
-    else:
-        raise NotImplementedError("Unknown file header. {}".format(header))
-
-    parent_element = file_element
-    depth_list = [file_element]
-    current_depth = 0
-
-    # parse through until EOF
-    while pos < eof:
-        next_char = unpack_from("c", fdata, offset=pos)[0].decode()
-        # we have a property
-        if next_char == "!":
-            # check the property type and values
-            prop_name, prop_values, pos = parseProperty(fdata, pos)
-
-            # assign property values to the parent object
-            parent_element.set(prop_name, prop_values)
-
-        # we have an object
-        elif next_char == "[":
-            # check the object type and hierarchy depth
-            obj_name, depth, pos = parseObject(fdata, pos)
-
-            # deeper branch of the tree => current parent valid
-            # same or shallower branch of the tree => parent gets redefined back a level
-            if not depth > current_depth:
-                # remove elements from depth list, change parent
-                depth_list = depth_list[:depth]
-                parent_element = depth_list[-1]
-
-            # create a new object as a child of the current parent
-            new_element = Xml.SubElement(parent_element, obj_name)
-            # update parent
-            parent_element = new_element
-            # update depth
-            depth_list.append(parent_element)
-            current_depth = depth
-
-        # we have something that we can't parse
+    with open(filepath, "rb") as fp:
+        # an empty file can't be mapped, and has no header either
+        if os.fstat(fp.fileno()).st_size == 0:
+            raise NotImplementedError("Unknown file header. {}".format(b""))
+
+        # map the file rather than reading it, data is paged in on demand as we parse instead of copied up front
+        fdata = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with closing(fdata):
+        # determine the file length and set initial file read position
+        eof = len(fdata)
+        pos = 0
+
+        # read the file header '@@b@'
+        header = fdata[:4]
+        if header == b"@@b@":
+            pos = 4
         else:
-            raise NotImplementedError("Unknown object encountered.")
+            raise NotImplementedError("Unknown file header. {}".format(header))
+
+        parent_element = file_element
+        depth_list = [file_element]
+        current_depth = 0
+
+        # element creation happens once per object, avoid the module attribute lookup each time
+        SubElement = Xml.SubElement
+
+        # parse through until EOF
+        while pos < eof:
+            # compare the raw byte, no need to unpack and decode it just to choose a branch
+            next_char = fdata[pos : pos + 1]
+            # we have a property
+            if next_char == b"!":
+                # check the property type and values
+                prop_name, prop_values, pos = parseProperty(fdata, pos)
+
+                # assign property values to the parent object
+                parent_element.set(prop_name, prop_values)
+
+            # we have an object
+            elif next_char == b"[":
+                # check the object type and hierarchy depth
+                obj_name, depth, pos = parseObject(fdata, pos)
+
+                # deeper branch of the tree => current parent valid
+                # same or shallower branch of the tree => parent gets redefined back a level
+                if not depth > current_depth:
+                    # remove elements from depth list (in place, rather than copying the list), change parent
+                    del depth_list[depth:]
+                    parent_element = depth_list[-1]
+
+                # create a new object as a child of the current parent
+                new_element = SubElement(parent_element, obj_name)
+                # update parent
+                parent_element = new_element
+                # update depth
+                depth_list.append(parent_element)
+                current_depth = depth
+
+            # we have something that we can't parse
+            else:
+                raise NotImplementedError("Unknown object encountered.")
 
     return file_element
 
@@ -281,129 +368,268 @@ def read_meshfile(filepath):
 """
 
 
-def writeProperty(prop_name, prop_data):
-    datastring = b""
+def getDataType(prop_name, prop_data):
+    # typed arrays (as created when reading a file) already know their data type
+    if isinstance(prop_data, array) and prop_data.typecode in _ARRAY_DATATYPES:
+        return _ARRAY_DATATYPES[prop_data.typecode] if len(prop_data) else None
 
     try:
-        # write starting '!'
-        datastring += pack("c", "!".encode())
+        # determine the data type in the array
+        types = set([type(d) for d in prop_data])
+        if len(types) == 1:
+            datatype = types.pop()
+        elif len(types) < 1:
+            return None
+        else:
+            raise NotImplementedError("Mixed data type encountered. {} - {}".format(types, prop_data))
+
+        # the data is all of one type, so we only need to check that type and not every value again
+        if issubclass(datatype, int):
+            return "i"
+        elif issubclass(datatype, float):
+            return "f"
+        elif issubclass(datatype, basestring):
+            return "s"
+        else:
+            raise NotImplementedError("Unknown data type encountered. {}\n{}".format(datatype, prop_data))
+
+    except NotImplementedError as err:
+        print("Failed writing property: {}".format(prop_name))
+        raise err
 
-        # write length of property name
-        prop_name_length = len(prop_name)
-        datastring += pack("b", prop_name_length)
 
-        # write property name as string
-        datastring += writeString(prop_name)
+def encodeString(string):
+    # strings are written as latin-1 bytes, anything already encoded is written as is
+    if isinstance(string, bytes):
+        return string
+    try:
+        return string.encode("latin-1")
+    except UnicodeEncodeError:
+        raise NotImplementedError("String cannot be encoded as latin-1: {}".format(string))
+
 
-        # write property data
-        datastring += writeData(prop_data)
+def encodeProperty(prop_name, prop_data, datatype):
+    """
+        Returns the property name and data exactly as they will be written, the name and any string as latin-1 bytes and
+        numbers as a typed array. Anything which can't be written raises here, before the output file is touched.
+    """
+    try:
+        name_bytes = encodeString(prop_name)
+
+        if datatype in ("i", "f"):
+            typecode = _ARRAY_INT if datatype == "i" else _ARRAY_FLOAT
+            # reuse the data directly if it is already a typed array, otherwise copy it into one
+            if not (isinstance(prop_data, array) and prop_data.typecode == typecode):
+                try:
+                    prop_data = array(typecode, prop_data)
+                except (OverflowError, TypeError) as err:
+                    raise NotImplementedError("Invalid {} data encountered. {}".format(datatype, err))
+        elif datatype == "s":
+            prop_data = [encodeString(prop_data[0])]
 
     except NotImplementedError as err:
         print("Failed writing property: {}".format(prop_name))
         raise err
 
-    return datastring
+    return name_bytes, prop_data
+
 
+def sizeProperty(prop_name, prop_data, datatype):
+    # the property name length is written as a signed byte
+    if len(prop_name) > 127:
+        raise NotImplementedError("Property name is longer than 127 characters: {}".format(prop_name.decode("latin-1")))
 
-def writeObject(obj_xml, obj_depth):
-    datastring = b""
+    # starting '!', length of property name, property name
+    size = 1 + 1 + len(prop_name)
 
+    # property data
+    if datatype in ("i", "f"):
+        # type, count, values
+        size += 1 + 4 + 4 * len(prop_data)
+    elif datatype == "s":
+        # type, count, string length, value, zero-byte ending
+        size += 1 + 4 + 4 + len(prop_data[0]) + 1
+
+    return size
+
+
+def sizeObject(obj_name, obj_depth):
+    if not len(obj_name) < 64:
+        raise NotImplementedError("Object name is longer than 64 characters: {}".format(obj_name.decode("latin-1")))
+
+    # object hierarchy depth, object name, zero-byte ending
+    return obj_depth + len(obj_name) + 1
+
+
+def writeProperty(prop_name, prop_data, datatype, buf, offset):
+    # write starting '!'
+    _S_CHAR.pack_into(buf, offset, "!".encode())
+    offset += 1
+
+    # write length of property name
+    prop_name_length = len(prop_name)
+    _S_BYTE.pack_into(buf, offset, prop_name_length)
+    offset += 1
+
+    # write property name as string
+    offset = writeString(prop_name, buf, offset)
+
+    # write property data
+    offset = writeData(prop_data, datatype, buf, offset)
+
+    return offset
+
+
+def writeObject(obj_name, obj_depth, buf, offset):
     # write object hierarchy depth
-    for x in range(obj_depth):
-        datastring += pack("c", "[".encode())
+    buf[offset : offset + obj_depth] = b"[" * obj_depth
+    offset += obj_depth
 
     # write object name as string
-    obj_name = obj_xml.tag
-    if not len(obj_name) < 64:
-        raise NotImplementedError("Object name is longer than 64 characters: {}".format(obj_name))
-    datastring += writeString(obj_name)
+    offset = writeString(obj_name, buf, offset)
     # write zero-byte ending
-    datastring += pack("x")
+    _S_PAD.pack_into(buf, offset)
+    offset += 1
 
-    return datastring
+    return offset
 
 
-def writeString(string):
-    datastring = b""
+def writeString(string, buf, offset):
+    string = encodeString(string)
+    buf[offset : offset + len(string)] = string
 
-    string = string.encode("latin-1")
-    datastring += pack("{0}s".format(len(string)), string)
+    return offset + len(string)
 
-    return datastring
 
+def writeArray(typecode, data_array, buf, offset):
+    # reuse the data directly if it is already a typed array, otherwise copy it into one
+    values = data_array
+    if not (isinstance(data_array, array) and data_array.typecode == typecode):
+        values = array(typecode, data_array)
 
-def writeData(data_array):
-    datastring = b""
+    # file data is little-endian
+    if sys.byteorder != "little":
+        values = array(typecode, values)
+        values.byteswap()
 
-    # determine the data type in the array
-    types = set([type(d) for d in data_array])
-    if len(types) == 1:
-        datatype = types.pop()
-    elif len(types) < 1:
-        return datastring
-    else:
-        raise NotImplementedError("Mixed data type encountered. {} - {}".format(types, data_array))
+    raw = _array_tobytes(values)
+    buf[offset : offset + len(raw)] = raw
 
-    if all(isinstance(d, int) for d in data_array):
+    return offset + len(raw)
+
+
+def writeData(data_array, datatype, buf, offset):
+    if datatype == "i":
         # write integer data
-        datastring += pack("c", "i".encode())
+        _S_CHAR.pack_into(buf, offset, "i".encode())
+        offset += 1
 
         # write the data count
         size = len(data_array)
-        datastring += pack("i", size)
+        _S_INT.pack_into(buf, offset, size)
+        offset += 4
 
         # write the data values
-        datastring += pack("i" * size, *data_array)
+        offset = writeArray(_ARRAY_INT, data_array, buf, offset)
 
-    elif all(isinstance(d, float) for d in data_array):
+    elif datatype == "f":
         # write float data
-        datastring += pack("c", "f".encode())
+        _S_CHAR.pack_into(buf, offset, "f".encode())
+        offset += 1
 
         # count
         size = len(data_array)
-        datastring += pack("i", size)
+        _S_INT.pack_into(buf, offset, size)
+        offset += 4
 
         # values
-        datastring += pack("f" * size, *data_array)
+        offset = writeArray(_ARRAY_FLOAT, data_array, buf, offset)
 
-    elif all(isinstance(d, basestring) for d in data_array):
+    elif datatype == "s":
         # write string data
-        datastring += pack("c", "s".encode())
+        _S_CHAR.pack_into(buf, offset, "s".encode())
+        offset += 1
 
         # count
         size = 1
         # TODO: we are assuming that we always have a count of 1 string, not an array of multiple strings
-        datastring += pack("i", size)
+        _S_INT.pack_into(buf, offset, size)
+        offset += 4
 
         # string length
         str_data_length = len(data_array[0])
-        datastring += pack("i", (str_data_length + 1))  # string length + 1 to account for zero-byte ending
+        _S_INT.pack_into(buf, offset, str_data_length + 1)  # string length + 1 to account for zero-byte ending
+        offset += 4
 
         # values
-        datastring += writeString(data_array[0])  # Py2 struct.pack cannot handle unicode strings
+        offset = writeString(data_array[0], buf, offset)  # Py2 struct.pack cannot handle unicode strings
         # write zero-byte ending
-        datastring += pack("x")
-
-    else:
-        raise NotImplementedError("Unknown data type encountered. {}\n{}".format(datatype, data_array))
+        _S_PAD.pack_into(buf, offset)
+        offset += 1
 
-    return datastring
+    return offset
 
 
-def write_meshfile(filepath, root_xml):
+def writeAsset(filepath, asset_data):
     """
-        Iterates over an XML element and writes the element structure back into a binary file as mesh data.
+        Writes a sequence of objects and properties to a binary file. The exact size of the data is totalled first, so
+        everything is packed directly into the memory mapped output file.
     """
-    datastring = b""
+    header = b"@@b@"
+
+    # first pass, resolve the data type of each property and encode everything as it will be written, so the size of
+    # the file is totalled from the actual bytes and any data which can't be written fails before the file is opened
+    asset_items = []
+    total_size = len(header)
+    for item_type, name, value in asset_data:
+        if item_type == "[":
+            name = encodeString(name)
+            total_size += sizeObject(name, value)
+            asset_items.append((item_type, name, value, None))
+        else:
+            datatype = getDataType(name, value)
+            name, value = encodeProperty(name, value, datatype)
+            total_size += sizeProperty(name, value, datatype)
+            asset_items.append((item_type, name, value, datatype))
+
+    # size a temporary output file up front and map it, so data is packed straight into the file without a staging
+    # buffer, it only replaces the target once complete so a failed write leaves any existing file untouched
+    temp_path = filepath + ".tmp"
+    try:
+        with open(temp_path, "w+b") as fp:
+            fp.truncate(total_size)
+            with closing(mmap.mmap(fp.fileno(), total_size, access=mmap.ACCESS_WRITE)) as buf:
+                offset = 0
+
+                # write the file header '@@b@'
+                buf[offset : offset + len(header)] = header
+                offset += len(header)
+
+                # second pass, write each object and property in place
+                for item_type, name, value, datatype in asset_items:
+                    if item_type == "[":
+                        offset = writeObject(name, value, buf, offset)
+                    else:
+                        offset = writeProperty(name, value, datatype, buf, offset)
+
+                buf.flush()
+
+        replace_file(temp_path, filepath)
+
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
 
-    # write the file header '@@b@'
-    header = "@@b@"
-    for x in header:
-        datastring += pack("c", x.encode())
 
+def iterMeshData(root_xml):
+    """
+        Iterates over an XML element and yields each object ("[", name, depth) and property ("!", name, values) in the
+        order they are written as mesh data.
+    """
     # write the file properties
     if root_xml.tag == "File":
-        datastring += writeProperty("pdxasset", root_xml.get("pdxasset"))
+        yield "!", "pdxasset", root_xml.get("pdxasset")
     else:
         raise NotImplementedError("Unknown XML root encountered. {}".format(root_xml.tag))
 
@@ -412,94 +638,84 @@ def write_meshfile(filepath, root_xml):
     object_xml = root_xml.find("object")
     if object_xml is not None:
         current_depth = 1
-        datastring += writeObject(object_xml, current_depth)
+        yield "[", object_xml.tag, current_depth
 
         # write each shape node
         for shape_xml in object_xml:
             current_depth = 2
-            datastring += writeObject(shape_xml, current_depth)
+            yield "[", shape_xml.tag, current_depth
 
             # write each mesh
             for child_xml in shape_xml:
                 current_depth = 3
-                datastring += writeObject(child_xml, current_depth)
+                yield "[", child_xml.tag, current_depth
 
                 if child_xml.tag == "mesh":
                     mesh_xml = child_xml
                     # write mesh properties
                     for prop in ["p", "n", "ta", "u0", "u1", "u2", "u3", "tri"]:
                         if mesh_xml.get(prop) is not None:
-                            datastring += writeProperty(prop, mesh_xml.get(prop))
+                            yield "!", prop, mesh_xml.get(prop)
 
                     # write mesh sub-objects
                     aabb_xml = mesh_xml.find("aabb")
                     if aabb_xml is not None:
                         current_depth = 4
-                        datastring += writeObject(aabb_xml, current_depth)
+                        yield "[", aabb_xml.tag, current_depth
                         for prop in ["min", "max"]:
                             if aabb_xml.get(prop) is not None:
-                                datastring += writeProperty(prop, aabb_xml.get(prop))
+                                yield "!", prop, aabb_xml.get(prop)
 
                     material_xml = mesh_xml.find("material")
                     if material_xml is not None:
                         current_depth = 4
-                        datastring += writeObject(material_xml, current_depth)
+                        yield "[", material_xml.tag, current_depth
                         for prop in ["shader", "diff", "n", "spec"]:
                             if material_xml.get(prop) is not None:
-                                datastring += writeProperty(prop, material_xml.get(prop))
+                                yield "!", prop, material_xml.get(prop)
 
                     skin_xml = mesh_xml.find("skin")
                     if skin_xml is not None:
                         current_depth = 4
-                        datastring += writeObject(skin_xml, current_depth)
+                        yield "[", skin_xml.tag, current_depth
                         for prop in ["bones", "ix", "w"]:
                             if skin_xml.get(prop) is not None:
-                                datastring += writeProperty(prop, skin_xml.get(prop))
+                                yield "!", prop, skin_xml.get(prop)
 
                 elif child_xml.tag == "skeleton":
                     # write bone sub objects and properties
                     for bone_xml in child_xml:
                         current_depth = 4
-                        datastring += writeObject(bone_xml, current_depth)
+                        yield "[", bone_xml.tag, current_depth
                         for prop in ["ix", "pa", "tx"]:
                             if bone_xml.get(prop) is not None:
-                                datastring += writeProperty(prop, bone_xml.get(prop))
+                                yield "!", prop, bone_xml.get(prop)
 
     # write locators root
     locator_xml = root_xml.find("locator")
     if locator_xml is not None:
         current_depth = 1
-        datastring += writeObject(locator_xml, current_depth)
+        yield "[", locator_xml.tag, current_depth
 
         # write each locator
         for locnode_xml in locator_xml:
             current_depth = 2
-            datastring += writeObject(locnode_xml, current_depth)
+            yield "[", locnode_xml.tag, current_depth
 
             # write locator properties
             for prop in ["p", "q", "pa", "tx"]:
                 if locnode_xml.get(prop) is not None:
-                    datastring += writeProperty(prop, locnode_xml.get(prop))
-
-    # write the data
-    with open(filepath, "wb") as fp:
-        fp.write(datastring)
+                    yield "!", prop, locnode_xml.get(prop)
 
 
-def write_animfile(filepath, root_xml):
+def iterAnimData(root_xml):
     """
-        Iterates over an XML element and writes the element structure back into a binary file as animation data.
+        Iterates over an XML element and yields each object ("[", name, depth) and property ("!", name, values) in the
+        order they are written as animation data.
     """
-    datastring = b""
-
-    # write the file header '@@b@'
-    header = "@@b@"
-    for x in header:
-        datastring += pack("c", x.encode())
-
     # write the file properties
     if root_xml.tag == "File":
-        datastring += writeProperty("pdxasset", root_xml.get("pdxasset"))
+        yield "!", "pdxasset", root_xml.get("pdxasset")
     else:
         raise NotImplementedError("Unknown XML root encountered. {}".format(root_xml.tag))
 
@@ -507,37 +723,47 @@ def write_animfile(filepath, root_xml):
     info_xml = root_xml.find("info")
     if info_xml is not None:
         current_depth = 1
-        datastring += writeObject(info_xml, current_depth)
+        yield "[", info_xml.tag, current_depth
 
         # write info properties
         for prop in ["fps", "sa", "j"]:
             if info_xml.get(prop) is not None:
-                datastring += writeProperty(prop, info_xml.get(prop))
+                yield "!", prop, info_xml.get(prop)
 
         # write each bone
         for bone_xml in info_xml:
             current_depth = 2
-            datastring += writeObject(bone_xml, current_depth)
+            yield "[", bone_xml.tag, current_depth
 
             # write bone properties
             for prop in ["sa", "t", "q", "s"]:
                 if bone_xml.get(prop) is not None:
-                    datastring += writeProperty(prop, bone_xml.get(prop))
+                    yield "!", prop, bone_xml.get(prop)
 
     # write samples root
     samples_xml = root_xml.find("samples")
     if samples_xml is not None:
         current_depth = 1
-        datastring += writeObject(samples_xml, current_depth)
+        yield "[", samples_xml.tag, current_depth
 
         # write sample properties
         for prop in ["t", "q", "s"]:
             if samples_xml.get(prop) is not None:
-                datastring += writeProperty(prop, samples_xml.get(prop))
+                yield "!", prop, samples_xml.get(prop)
+
+
+def write_meshfile(filepath, root_xml):
+    """
+        Iterates over an XML element and writes the element structure back into a binary file as mesh data.
+    """
+    writeAsset(filepath, iterMeshData(root_xml))
+
 
-    # write the data
-    with open(filepath, "wb") as fp:
-        fp.write(datastring)
+def write_animfile(filepath, root_xml):
+    """
+        Iterates over an XML element and writes the element structure back into a binary file as animation data.
+    """
+    writeAsset(filepath, iterAnimData(root_xml))
 
 
 """ ====================================================================================================================
@@ -11,9 +11,14 @@ from __future__ import print_function, unicode_literals
 
 import os
 import sys
+import math
 import time
+import logging
+import heapq
+from array import array
+from functools import wraps
 from operator import itemgetter
-from collections import OrderedDict, namedtuple, defaultdict
+from collections import OrderedDict, namedtuple
 
 try:
     import xml.etree.cElementTree as Xml
@@ -30,7 +35,7 @@ import maya.OpenMayaAnim as OpenMayaAnim
 
 # Maya Python API 2.0
 import maya.api.OpenMaya as OpenMayaAPI
-from maya.api.OpenMaya import MVector, MMatrix, MTransformationMatrix, MQuaternion
+from maya.api.OpenMaya import MVector, MMatrix, MTransformationMatrix, MQuaternion, MEulerRotation
 
 from .. import pdx_data
 from .. import IO_PDX_LOG
@@ -39,6 +44,12 @@ from .. import IO_PDX_LOG
 if sys.version_info >= (3, 0):
     xrange = range
 
+# plain dicts keep insertion order from Py3.7, only fall back to the slower OrderedDict where they don't
+if sys.version_info >= (3, 7):
+    ordered_dict = dict
+else:
+    ordered_dict = OrderedDict
+
 
 """ ====================================================================================================================
     Variables.
@@ -73,10 +84,14 @@ if maya_up == "z":
         (0, 0, 0, 1)
     ))
 # fmt: on
+SPACE_MATRIX_INV = SPACE_MATRIX.inverse()
 
 # simple datatype for animation clips
 AnimClip = namedtuple("AnimClip", ["name", "start", "end"])
 
+# skeleton hierarchies by root bone, only populated for the duration of an export so scene edits are never missed
+_hierarchy_cache = None
+
 
 """ ====================================================================================================================
     API functions.
@@ -84,18 +99,23 @@ AnimClip = namedtuple("AnimClip", ["name", "start", "end"])
 """
 
 
+# selection lists re-used for every name lookup, rather than allocating a new list each call
+_sel_list = OpenMayaAPI.MSelectionList()
+_m_SelList = OpenMaya.MSelectionList()
+
+
 def get_mobject(name):
-    sel_list = OpenMayaAPI.MSelectionList()
-    sel_list.add(name)
-    m_obj = sel_list.getDependNode(0)
+    _sel_list.clear()
+    _sel_list.add(name)
+    m_obj = _sel_list.getDependNode(0)
 
     return m_obj
 
 
 def get_dagpath(name):
-    sel_list = OpenMayaAPI.MSelectionList()
-    sel_list.add(name)
-    m_dagpath = sel_list.getDagPath(0)
+    _sel_list.clear()
+    _sel_list.add(name)
+    m_dagpath = _sel_list.getDagPath(0)
 
     return m_dagpath
 
@@ -110,9 +130,9 @@ def get_dagnode(name):
 def get_MObject(object_name):
     m_Obj = OpenMaya.MObject()
 
-    m_SelList = OpenMaya.MSelectionList()
-    m_SelList.add(object_name)
-    m_SelList.getDependNode(0, m_Obj)
+    _m_SelList.clear()
+    _m_SelList.add(object_name)
+    _m_SelList.getDependNode(0, m_Obj)
 
     return m_Obj
 
@@ -120,9 +140,9 @@ def get_MObject(object_name):
 def get_MDagPath(object_name):
     m_DagPath = OpenMaya.MDagPath()
 
-    m_SelList = OpenMaya.MSelectionList()
-    m_SelList.add(object_name)
-    m_SelList.getDagPath(0, m_DagPath)
+    _m_SelList.clear()
+    _m_SelList.add(object_name)
+    _m_SelList.getDagPath(0, m_DagPath)
 
     return m_DagPath
 
@@ -134,6 +154,16 @@ def get_plug(mobject, plug_name):
     return mplug
 
 
+def get_plug_source(mplug):
+    """ Returns the node connected as input to the plug, or None if the plug is not a connection destination. """
+    mplugs = OpenMaya.MPlugArray()
+    mplug.connectedTo(mplugs, True, False)
+    if mplugs.length() == 0:
+        return None
+
+    return mplugs[0].node()
+
+
 def connect_nodeplugs(source_mobject, source_mplug, dest_mobject, dest_mplug):
     source_mplug = get_plug(source_mobject, source_mplug)
     dest_mplug = get_plug(dest_mobject, dest_mplug)
@@ -154,6 +184,17 @@ def util_round(data, ndigits=0):
     return tuple(round(x, ndigits) for x in data)
 
 
+def util_round_list(data_list, ndigits=0):
+    """ Element-wise rounding of every item in a list of data, done in one pass rather than one call per item. """
+    return [tuple(round(x, ndigits) for x in data) for data in data_list]
+
+
+def util_value_keys(data_list, keys=None):
+    """ Returns an integer key for every item in a list of data, items which compare equal share the same key. """
+    keys = {} if keys is None else keys
+    return [keys.setdefault(data, len(keys)) for data in data_list]
+
+
 def clean_imported_name(name):
     # strip any namespace names, taking the final name only
     clean_name = name.split(":")[-1]
@@ -165,15 +206,36 @@ def clean_imported_name(name):
 
 
 def list_scene_pdx_materials():
-    return [mat for mat in pmc.ls(materials=True) if hasattr(mat, PDX_SHADER)]
-
+    # check for the shader attribute through the API, so PyNodes are only created for PDX materials
+    return [
+        pmc.PyNode(name)
+        for name in cmds.ls(materials=True)
+        if OpenMayaAPI.MFnDependencyNode(get_mobject(name)).hasAttribute(PDX_SHADER)
+    ]
+
+
+def list_scene_rootbones(attribute=None):
+    """ Returns the root node of every joint hierarchy in the scene. Optionally only those roots which have the named
+    attribute, this is checked through the API before any PyNodes are created. """
+    # the root of each joints hierarchy is the first node in its full DAG path, so no parent walks are needed
+    root_names = OrderedDict()
+    dag_iter = OpenMayaAPI.MItDag(OpenMayaAPI.MItDag.kDepthFirst, OpenMayaAPI.MFn.kJoint)
+    while not dag_iter.isDone():
+        root_names["|" + dag_iter.fullPathName().split("|")[1]] = None
+        dag_iter.next()
+
+    if attribute is not None:
+        root_names = [
+            name for name in root_names if OpenMayaAPI.MFnDependencyNode(get_mobject(name)).hasAttribute(attribute)
+        ]
 
-def list_scene_rootbones():
-    return list(set([bone.root() for bone in pmc.ls(type="joint")]))
+    return [pmc.PyNode(name) for name in root_names]
 
 
 def list_scene_pdx_meshes():
-    return [mesh for mesh in pmc.ls(type="mesh", noIntermediate=True) if check_mesh_material(mesh)]
+    # meshes commonly share shading groups, so only check each once
+    sg_cache = {}
+    return [mesh for mesh in pmc.ls(type="mesh", noIntermediate=True) if check_mesh_material(mesh, sg_cache)]
 
 
 def set_local_axis_display(state, object_type=None, object_list=None):
@@ -215,10 +277,8 @@ def get_animation_clips(bone_list):
 
     if attr_string and attr_string != "":
         for clip_string in attr_string.split("@"):
-            anim_clip = AnimClip(
-                clip_string.split("~")[0], int(clip_string.split("~")[1]), int(clip_string.split("~")[2])
-            )
-            anim_clips.append(anim_clip)
+            name, start, end = clip_string.split("~", 2)
+            anim_clips.append(AnimClip(name, int(start), int(end)))
 
         # sort clips by start frame
         anim_clips.sort(key=lambda clip: clip.start)
@@ -233,7 +293,7 @@ def set_animation_clips(bone_list, clips_list):
     clips_list.sort(key=lambda clip: clip.start)
 
     # write the attribute string back to the root bone
-    attr_string = "@".join(["~".join([str(getattr(clip, f)) for f in clip._fields]) for clip in clips_list])
+    attr_string = "@".join("{0}~{1}~{2}".format(*clip) for clip in clips_list)
     getattr(root_bone, PDX_ANIMATION).set(attr_string)
 
 
@@ -280,21 +340,29 @@ def set_mesh_index(maya_mesh, i):
 
 
 def get_mesh_index(maya_mesh):
-    if hasattr(maya_mesh, PDX_MESHINDEX):
-        return getattr(maya_mesh, PDX_MESHINDEX).get()
+    # read through the API, used as a sort key so this avoids creating PyMEL attributes for every mesh
+    mFn_DepNode = OpenMaya.MFnDependencyNode(maya_mesh.__apimobject__())
+    if mFn_DepNode.hasAttribute(PDX_MESHINDEX):
+        return mFn_DepNode.findPlug(PDX_MESHINDEX).asInt()
     else:
         return 255
 
 
-def check_mesh_material(maya_mesh):
-    result = False
+def check_mesh_material(maya_mesh, sg_cache=None):
+    """ Returns True if any material on the mesh is a PDX material. Optionally takes a dictionary used to cache the
+    result per shading group, across multiple calls. """
+    sg_cache = {} if sg_cache is None else sg_cache
 
-    shadingengines = list(set(pmc.listConnections(maya_mesh, type="shadingEngine")))
+    shadingengines = set(pmc.listConnections(maya_mesh, type="shadingEngine"))
     for sg in shadingengines:
-        material = pmc.listConnections(sg.surfaceShader)[0]
-        result = result or hasattr(material, PDX_SHADER)  # needs at least one of it's materials to be a PDX material
+        if sg not in sg_cache:
+            material = pmc.listConnections(sg.surfaceShader)[0]
+            sg_cache[sg] = hasattr(material, PDX_SHADER)
+        # needs at least one of it's materials to be a PDX material
+        if sg_cache[sg]:
+            return True
 
-    return result
+    return False
 
 
 def get_material_shader(maya_material):
@@ -314,15 +382,18 @@ def get_material_shader(maya_material):
 def get_material_textures(maya_material):
     texture_dict = dict()
 
-    if maya_material.color.connections():
-        texture_dict["diff"] = maya_material.color.connections()[0].fileTextureName.get()
+    diff_connections = maya_material.color.connections()
+    if diff_connections:
+        texture_dict["diff"] = diff_connections[0].fileTextureName.get()
 
-    if maya_material.normalCamera.connections():
-        bump2d = maya_material.normalCamera.connections()[0]
-        texture_dict["n"] = bump2d.bumpValue.connections()[0].fileTextureName.get()
+    norm_connections = maya_material.normalCamera.connections()
+    if norm_connections:
+        bump2d_file = norm_connections[0].bumpValue.connections()[0]
+        texture_dict["n"] = bump2d_file.fileTextureName.get()
 
-    if maya_material.specularColor.connections():
-        texture_dict["spec"] = maya_material.specularColor.connections()[0].fileTextureName.get()
+    spec_connections = maya_material.specularColor.connections()
+    if spec_connections:
+        texture_dict["spec"] = spec_connections[0].fileTextureName.get()
 
     return texture_dict
 
@@ -341,144 +412,156 @@ def get_mesh_info(maya_mesh, split_all_vertices=False, round_data=False):
     else:
         raise RuntimeError("Unsupported mesh type encountered. {0}".format(type(maya_mesh)))
 
-    # we will need to test vertices for equality based on their attributes
-    # critically: whether per-face vertices (sharing an object-relative vert id) share normals and uvs
-    UniqueVertex = namedtuple("UniqueVertex", ["id", "p", "n", "uv"])
-
-    # API mesh function set
-    mesh_obj = get_mobject(mesh.name())
-    mFn_Mesh = OpenMayaAPI.MFnMesh(mesh_obj)
+    # API mesh function set, world space queries need a DAG path
+    mFn_Mesh = OpenMayaAPI.MFnMesh(get_dagpath(mesh.name()))
+    world_space = OpenMayaAPI.MSpace.kWorld
 
-    # cache some mesh data
-    vertices = mesh.getPoints(space="world")  # list of vertices positions
-    normals = mesh.getNormals(space="world")  # list of vectors for each vertex per face
-    triangles = mesh.getTriangles()
-    uv_setnames = [uv_set for uv_set in mesh.getUVSetNames() if mFn_Mesh.numUVs(uv_set) > 0][:PDX_MAXUVSETS]
+    # cache some mesh data, converting bulk arrays to game space once per element rather than once per tri-vert
+    vertices = [swap_vec3(pt.x, pt.y, pt.z) for pt in mFn_Mesh.getPoints(world_space)]  # vertex positions
+    normals = [swap_vec3(nrm.x, nrm.y, nrm.z) for nrm in mFn_Mesh.getNormals(world_space)]  # per face-vertex
+    triangle_counts = mFn_Mesh.getTriangles()[0]  # number of triangles making each face
+    uv_setnames = [uv_set for uv_set in mFn_Mesh.getUVSetNames() if mFn_Mesh.numUVs(uv_set) > 0][:PDX_MAXUVSETS]
     uv_coords = {}
     tangents = None
     for i, uv_set in enumerate(uv_setnames):
-        _u, _v = mesh.getUVs(uvSet=uv_set)
-        uv_coords[i] = zip(_u, _v)
+        _u, _v = mFn_Mesh.getUVs(uv_set)
+        uv_coords[i] = [swap_uv(u, v) for u, v in zip(_u, _v)]
     if uv_setnames:
-        tangents = mesh.getTangents(space="world", uvSet=uv_setnames[0])
+        tangents = [swap_vec3(tan.x, tan.y, tan.z) for tan in mFn_Mesh.getTangents(world_space, uv_setnames[0])]
+
+    # round bulk mesh data up front, rather than every time a vertex is referenced by a tri
+    if round_data:
+        vertices = util_round_list(vertices, PDX_DECIMALPTS)
+        normals = util_round_list(normals, PDX_DECIMALPTS)
+        if tangents:
+            tangents = util_round_list(tangents, PDX_DECIMALPTS)
+        for i in uv_coords:
+            uv_coords[i] = util_round_list(uv_coords[i], PDX_DECIMALPTS)
+
+    # we will need to test vertices for equality based on their attributes
+    # critically: whether per-face vertices (sharing an object-relative vert id) share normals and uvs
+    # position is implied by the vert id, and each distinct normal and uv value gets an integer key, so that comparing
+    # tri-verts only has to hash a few ints rather than nested tuples of floats
+    normal_keys = util_value_keys(normals)
+    uv_key_map = {}
+    uv_keys = {i: util_value_keys(uv_coords[i], uv_key_map) for i in uv_coords}
+    uv_null_key = uv_key_map.setdefault((0.0, 0.0), len(uv_key_map))
 
     # build a blank dictionary of mesh information for the exporter
     mesh_dict = {x: [] for x in ["p", "n", "ta", "u0", "u1", "u2", "u3", "tri", "min", "max"]}
 
-    # collect all unique verts in the order that we process them
-    export_verts = []
-    unique_verts = set()
-
-    for face in meshfaces:
-        face_id = face.index()
-        face_vert_ids = face.getVertices()  # vertices making this face
-        num_triangles = triangles[0][face_id]  # number of triangles making this face
+    # collect all unique verts in the order that we process them, mapped to their index in the export
+    vert_id_list = []
+    unique_verts = {}
+
+    # bind everything used per tri-vert to locals up front, the loop below runs for every tri-vert in the mesh
+    getPolygonUVid = mFn_Mesh.getPolygonUVid
+    getTangentId = mFn_Mesh.getTangentId
+    isRightHandedTangent = mFn_Mesh.isRightHandedTangent
+    uv_sets = list(enumerate(uv_setnames))
+    export_tangents = bool(uv_setnames and tangents)
+    out_p, out_n, out_ta, out_tri = mesh_dict["p"], mesh_dict["n"], mesh_dict["ta"], mesh_dict["tri"]
+    out_uvs = [mesh_dict["u" + str(i)] for i, _ in uv_sets]
+
+    for face_id in meshfaces.indices():
+        # vertices making this face, mapped to their face relative index
+        face_local_ids = {vert_id: i for i, vert_id in enumerate(mFn_Mesh.getPolygonVertices(face_id))}
+        face_norm_ids = mFn_Mesh.getFaceNormalIds(face_id)  # normals of this face, in face-vertex order
+        num_triangles = triangle_counts[face_id]
 
         # store data for each tri of each face
         for tri in xrange(0, num_triangles):
-            tri_vert_ids = mesh.getPolygonTriangleVertices(face_id, tri)  # vertices making this triangle
+            tri_vert_ids = mFn_Mesh.getPolygonTriangleVertices(face_id, tri)  # vertices making this triangle
 
             # implementation note: the official PDX exporter seems to process verts, in vertex order, for each triangle
             # we must sort the list of tri-verts in vertex order, as by default Maya can return a different order
             # required to support exporting new Blendshape targets where the base mesh came from the PDX exporter
-            _sorted = sorted(enumerate(tri_vert_ids), key=lambda x: x[1])
-            sorted_indices = [i[0] for i in _sorted]  # track sorting change
-            sorted_tri_vert_ids = [i[1] for i in _sorted]
+            sorted_indices = sorted((0, 1, 2), key=tri_vert_ids.__getitem__)  # track sorting change
+            sorted_tri_vert_ids = [tri_vert_ids[j] for j in sorted_indices]
 
             dict_vert_idx = []
 
             # loop over tri verts
             for vert_id in sorted_tri_vert_ids:
-                _local_id = face_vert_ids.index(vert_id)  # face relative vertex index
+                _local_id = face_local_ids[vert_id]  # face relative vertex index
 
                 # position
                 _position = vertices[vert_id]
-                _position = swap_coord_space(_position)
-                if round_data:
-                    _position = util_round(list(_position), PDX_DECIMALPTS)
 
                 # normal
-                vert_norm_id = face.normalIndex(_local_id)
-                _normal = list(normals[vert_norm_id])
-                _normal = swap_coord_space(_normal)
-                if round_data:
-                    _normal = util_round(list(_normal), PDX_DECIMALPTS)
+                vert_norm_id = face_norm_ids[_local_id]
+                _normal = normals[vert_norm_id]
 
                 # uv
-                _uv_coords = ()
-                for i, uv_set in enumerate(uv_setnames):
+                _uv_coords = []
+                _uv_keys = []
+                for i, uv_set in uv_sets:
                     try:
-                        vert_uv_id = face.getUVIndex(_local_id, uv_set)
-                        uv = uv_coords[i][vert_uv_id]
-                        uv = swap_coord_space(uv)
-                        if round_data:
-                            uv = util_round(list(uv), PDX_DECIMALPTS)
+                        vert_uv_id = getPolygonUVid(face_id, _local_id, uv_set)
+                        _uv_coords.append(uv_coords[i][vert_uv_id])
+                        _uv_keys.append(uv_keys[i][vert_uv_id])
                     # case where verts are unmapped, eg when two meshes are merged with different UV set counts
                     except RuntimeError:
-                        uv = (0.0, 0.0)
-                    _uv_coords += (uv,)
+                        _uv_coords.append((0.0, 0.0))
+                        _uv_keys.append(uv_null_key)
 
                 # tangent (omitted if there were no UVs)
-                if uv_setnames and tangents:
-                    vert_tangent_id = mesh.getTangentId(face_id, vert_id)
-                    _binormal_sign = 1.0 if mFn_Mesh.isRightHandedTangent(vert_tangent_id, uv_setnames[0]) else -1.0
-                    _tangent = list(tangents[vert_tangent_id])
-                    _tangent = swap_coord_space(_tangent)
-                    if round_data:
-                        _tangent = util_round(list(_tangent), PDX_DECIMALPTS)
+                if export_tangents:
+                    vert_tangent_id = getTangentId(face_id, vert_id)
+                    _binormal_sign = 1.0 if isRightHandedTangent(vert_tangent_id, uv_setnames[0]) else -1.0
+                    _tangent = tangents[vert_tangent_id]
 
                 # check if this tri-vert is new and unique, or can if we can just use an existing vertex
-                new_vert = UniqueVertex(vert_id, tuple(_position), tuple(_normal), _uv_coords)
+                new_vert = (vert_id, normal_keys[vert_norm_id], tuple(_uv_keys))
 
-                # test if we have already stored this vertex in the unique set
+                # test if we have already stored this vertex in the unique dict
                 i = None
                 if not split_all_vertices:
-                    if new_vert in unique_verts:
-                        # no new data to be added to the mesh dict, the tri will reference an existing vert
-                        i = export_verts.index(new_vert)
+                    # if found, no new data to be added to the mesh dict, the tri will reference an existing vert
+                    i = unique_verts.get(new_vert)
 
                 if i is None:
                     # collect the new vertex
-                    unique_verts.add(new_vert)
-                    export_verts.append(new_vert)
+                    unique_verts[new_vert] = len(vert_id_list)
+                    vert_id_list.append(vert_id)
 
                     # add this vert data to the mesh dict
-                    mesh_dict["p"].extend(_position)
-                    mesh_dict["n"].extend(_normal)
-                    for i, uv_set in enumerate(uv_setnames):
-                        mesh_dict["u" + str(i)].extend(_uv_coords[i])
+                    out_p.extend(_position)
+                    out_n.extend(_normal)
+                    for out_uv, _uv in zip(out_uvs, _uv_coords):
+                        out_uv.extend(_uv)
                     if uv_setnames:
-                        mesh_dict["ta"].extend(_tangent)
-                        mesh_dict["ta"].append(_binormal_sign)  # UV winding order
+                        out_ta.extend(_tangent)
+                        out_ta.append(_binormal_sign)  # UV winding order
                     # the tri will reference the last added vertex
-                    i = len(export_verts) - 1
+                    i = len(vert_id_list) - 1
 
                 # store the tri-vert reference
                 dict_vert_idx.append(i)
 
             # tri-faces (converting handedness to Game space)
-            mesh_dict["tri"].extend(
+            out_tri.extend(
                 # to build the tri-face correctly, we need to use the original unsorted vertex order to reference verts
                 [dict_vert_idx[sorted_indices[0]], dict_vert_idx[sorted_indices[2]], dict_vert_idx[sorted_indices[1]]]
             )
 
-    # calculate min and max bounds of mesh
-    x_vtx_pos = set([mesh_dict["p"][j] for j in xrange(0, len(mesh_dict["p"]), 3)])
-    y_vtx_pos = set([mesh_dict["p"][j + 1] for j in xrange(0, len(mesh_dict["p"]), 3)])
-    z_vtx_pos = set([mesh_dict["p"][j + 2] for j in xrange(0, len(mesh_dict["p"]), 3)])
+    # calculate min and max bounds of mesh, over strided slices of each axis
+    x_vtx_pos, y_vtx_pos, z_vtx_pos = mesh_dict["p"][0::3], mesh_dict["p"][1::3], mesh_dict["p"][2::3]
     mesh_dict["min"] = [min(x_vtx_pos), min(y_vtx_pos), min(z_vtx_pos)]
     mesh_dict["max"] = [max(x_vtx_pos), max(y_vtx_pos), max(z_vtx_pos)]
 
-    # create an ordered list of vertex ids that we have gathered into the mesh dict
-    vert_id_list = [vert.id for vert in export_verts]
-
+    # vert_id_list is the ordered list of vertex ids that we have gathered into the mesh dict
     return mesh_dict, vert_id_list
 
 
-def get_mesh_skin_info(maya_mesh, vertex_ids=None):
+def get_mesh_skin_info(maya_mesh, vertex_ids=None, skin_cache=None):
     """
     pmc.skinPercent(skin, maya_mesh, normalize=True, pruneWeights=0.1)
+
+    Optionally takes a dictionary used to cache the weights read per mesh, across multiple calls (one per material).
     """
+    skin_cache = {} if skin_cache is None else skin_cache
+
     skinclusters = list(set(pmc.listConnections(maya_mesh, type="skinCluster")))
     if not skinclusters:
         return None
@@ -499,35 +582,37 @@ def get_mesh_skin_info(maya_mesh, vertex_ids=None):
         )
     skin_dict["bones"].append(skin_maxinfs)
 
-    # find all bones in hierarchy
-    skin_bones = skin.influenceObjects()
-    all_bones = get_skeleton_hierarchy(skin_bones)
-
-    # parse all verts in order if we didn't supply a subset of vert ids
-    if vertex_ids is None:
-        vertex_ids = xrange(len(maya_mesh.verts))
+    # the weights of every vertex are read together, so only do this once per mesh
+    if maya_mesh not in skin_cache:
+        # find all bones in hierarchy
+        skin_bones = skin.influenceObjects()
+        all_bones = get_skeleton_hierarchy(skin_bones)
 
-    # iterate over influences to find weights, per vertex
-    vert_weights = {v: {} for v in vertex_ids}
-    for bone in skin_bones:
-        try:
-            bone_index = all_bones.index(bone)
-        except ValueError:
-            raise RuntimeError(
-                "A skinned bone ({0}) is being excluded from export! Check all bones using the '{1}' property.".format(
-                    bone, PDX_IGNOREJOINT
+        # map each influence to its bone index in the exported hierarchy
+        # do not use skin.indexForInfluenceObject (bones can be plugged into the cluster but are not influence objects)
+        inf_bone_indices = []
+        for bone in skin_bones:
+            try:
+                inf_bone_indices.append(all_bones.index(bone))
+            except ValueError:
+                raise RuntimeError(
+                    "A skinned bone ({0}) is being excluded from export! Check all bones using the '{1}' "
+                    "property.".format(bone, PDX_IGNOREJOINT)
                 )
-            )
 
-        # do not use skin.indexForInfluenceObject (bones can be plugged into the cluster but are not influence objects)
-        inf_index = skin_bones.index(bone)
+        # get weights for all influences at once, storing any non-zero weights, by influence, per vertex
+        skin_cache[maya_mesh] = [
+            {bone_index: weight for bone_index, weight in zip(inf_bone_indices, inf_weights) if weight != 0.0}
+            for inf_weights in skin.getWeights(maya_mesh)
+        ]
+    mesh_weights = skin_cache[maya_mesh]
+
+    # parse all verts in order if we didn't supply a subset of vert ids
+    if vertex_ids is None:
+        vertex_ids = xrange(len(mesh_weights))
 
-        for vert_id, weight in enumerate(skin.getWeights(maya_mesh, influenceIndex=inf_index)):
-            # check we actually want this vertex (in case of material split meshes)
-            if vert_id in vertex_ids:
-                # store any non-zero weights, by influence, per vertex
-                if weight != 0.0:
-                    vert_weights[vert_id][bone_index] = weight
+    # only take the vertices we actually want (in case of material split meshes)
+    vert_weights = {v: mesh_weights[v] for v in vertex_ids}
 
     # collect data from the weights dict into the skin dict
     for vtx in vertex_ids:
@@ -538,15 +623,14 @@ def get_mesh_skin_info(maya_mesh, vertex_ids=None):
                     maya_mesh.getTransform().name(), PDX_MAXSKININFS
                 )
             )
-            # sort by influence and remove the smallest
-            inf_weights = sorted(vert_weights[vtx].items(), key=itemgetter(1), reverse=True)
-            inf_weights = dict(inf_weights[:PDX_MAXSKININFS])
-            total = sum(inf_weights.values())
+            # keep only the largest influences
+            inf_weights = heapq.nlargest(PDX_MAXSKININFS, vert_weights[vtx].items(), key=itemgetter(1))
+            total = sum(weight for _, weight in inf_weights)
 
-            vert_weights[vtx] = {inf: weight / total for inf, weight in inf_weights.items()}
+            vert_weights[vtx] = {inf: weight / total for inf, weight in inf_weights}
 
         # store influence and weight data
-        for influence, weight in vert_weights[vtx].iteritems():
+        for influence, weight in vert_weights[vtx].items():
             skin_dict["ix"].append(influence)
             skin_dict["w"].append(weight)
 
@@ -576,22 +660,23 @@ def get_mesh_skeleton_info(maya_mesh):
 def get_bones_info(maya_bones):
     # build a list of bone information dictionaries for the exporter
     bone_list = [{"name": x.name()} for x in maya_bones]
+    bone_indices = {bone: i for i, bone in enumerate(maya_bones)}
+
+    # matrix elements to export, the first three columns of each row
+    tx_indices = [0, 1, 2, 4, 5, 6, 8, 9, 10, 12, 13, 14]
 
     for i, bone in enumerate(maya_bones):
         # bone index
         bone_list[i]["ix"] = [i]
 
         # bone parent index
-        if bone.getParent():
-            bone_list[i]["pa"] = [maya_bones.index(bone.getParent())]
+        bone_parent = bone.getParent()
+        if bone_parent:
+            bone_list[i]["pa"] = [bone_indices[bone_parent]]
 
         # bone inverse world-space transform
-        mat = list(swap_coord_space(bone.getMatrix(worldSpace=True)).inverse())
-        bone_list[i]["tx"] = []
-        bone_list[i]["tx"].extend(mat[0:3])
-        bone_list[i]["tx"].extend(mat[4:7])
-        bone_list[i]["tx"].extend(mat[8:11])
-        bone_list[i]["tx"].extend(mat[12:15])
+        mat = swap_coord_space(bone.getMatrix(worldSpace=True)).inverse()
+        bone_list[i]["tx"] = [mat[j] for j in tx_indices]
 
     return bone_list
 
@@ -616,7 +701,7 @@ def get_locators_info(maya_locators):
         locator_list[i]["q"] = list(swap_coord_space(_rotation))
 
         _scale = loc.getScale()
-        is_scaled = util_round(list(_scale), PDX_ROUND_SCALE) != (1.0, 1.0, 1.0)
+        is_scaled = util_round(_scale, PDX_ROUND_SCALE) != (1.0, 1.0, 1.0)
         # TODO: check engine config here to see if full 'tx' attribute is supported
         if is_scaled:
             _transform = loc.getMatrix()
@@ -643,6 +728,10 @@ def get_skeleton_hierarchy(bone_list):
 
     root_bone = list(root_bone)[0]
 
+    # re-use the hierarchy if we have already walked this skeleton
+    if _hierarchy_cache is not None and root_bone in _hierarchy_cache:
+        return list(_hierarchy_cache[root_bone])
+
     def get_recursive_children(bone, hierarchy):
         hierarchy.append(bone)
         children = [
@@ -659,9 +748,27 @@ def get_skeleton_hierarchy(bone_list):
     valid_bones = []
     get_recursive_children(root_bone, valid_bones)
 
+    if _hierarchy_cache is not None:
+        _hierarchy_cache[root_bone] = list(valid_bones)
+
     return valid_bones
 
 
+def cache_skeleton_hierarchy(func):
+    """ Decorator, caches skeleton hierarchies for the duration of the wrapped function. """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        global _hierarchy_cache
+        _hierarchy_cache = {}
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _hierarchy_cache = None
+
+    return wrapper
+
+
 def get_animation_fps():
     time_unit = pmc.currentUnit(query=True, time=True)
 
@@ -673,49 +780,114 @@ def get_animation_fps():
         raise RuntimeError("Unsupported animation speed. {0}".format(time_unit))
 
 
+def get_bone_animcurves(bone):
+    """ Returns a list of animation curves, or static values where the attribute is not animated, for each transform
+    attribute of the bone. Returns None if the bone transform is driven by anything other than time based curves. """
+    bone_obj = get_MObject(bone.name())
+
+    # connections to the compound attributes or joint orientation can't be sampled from the individual curves
+    for attr in ["translate", "rotate", "scale", "jointOrient", "rotateOrder"]:
+        if get_plug_source(get_plug(bone_obj, attr)) is not None:
+            return None
+
+    anim_curves = []
+    for attr in [_attr + axis for _attr in ["translate", "rotate", "scale"] for axis in "XYZ"]:
+        plug = get_plug(bone_obj, attr)
+        source_obj = get_plug_source(plug)
+
+        # static attribute
+        if source_obj is None:
+            anim_curves.append(plug.asDouble())
+            continue
+
+        # animation curve, which must be driven directly by scene time (not by layers, drivers or constraints etc)
+        if not source_obj.hasFn(OpenMaya.MFn.kAnimCurve):
+            return None
+        mFn_AnimCurve = OpenMayaAnim.MFnAnimCurve(source_obj)
+        if not mFn_AnimCurve.isTimeInput() or get_plug_source(get_plug(source_obj, "input")) is not None:
+            return None
+        anim_curves.append(mFn_AnimCurve)
+
+    return anim_curves
+
+
 def get_scene_animdata(export_bones, startframe, endframe, round_data=True):
-    # store transform for each bone over the frame range
-    frames_data = defaultdict(list)
+    # store transform for each bone over the frame range, as separate lists of translation, rotation and scale
+    frames_data = {bone.name(): ([], [], []) for bone in export_bones}
 
-    try:
-        cmds.refresh(suspend=True)
-        for f in xrange(startframe, endframe + 1):
-            pmc.currentTime(f, edit=True)
-            for bone in export_bones:
-                # TODO: this is slow, don't use PyMel here or check f-curves directly
-                _translation = swap_coord_space(bone.getTranslation())
-                # bone rotation must be pre-multiplied by joint orientation
-                _rotation = swap_coord_space(bone.getRotation(quaternion=True) * bone.getOrientation())
-                _scale = bone.getScale()
+    # bones animated purely by curves can be sampled directly, without evaluating the whole scene at every frame
+    frame_times = [OpenMaya.MTime(f, OpenMaya.MTime.uiUnit()) for f in xrange(startframe, endframe + 1)]
+    scrub_bones = []
+    for bone in export_bones:
+        anim_curves = get_bone_animcurves(bone)
+        if anim_curves is None:
+            scrub_bones.append(bone)
+            continue
 
-                frames_data[bone.name()].append((_translation, _rotation, _scale))
+        # evaluate each curve over the frame range, static attributes just repeat their value
+        samples = []
+        for curve in anim_curves:
+            if isinstance(curve, OpenMayaAnim.MFnAnimCurve):
+                samples.append([curve.evaluate(t) for t in frame_times])
+            else:
+                samples.append([curve] * len(frame_times))
+        rotate_order = bone.rotateOrder.get()
+        orientation = MQuaternion(*bone.getOrientation())
 
-    except Exception as err:
-        IO_PDX_LOG.error(err)
-        raise
+        t_list, q_list, s_list = frames_data[bone.name()]
+        t_list.extend(swap_vec3(tx, ty, tz) for tx, ty, tz in zip(*samples[0:3]))
+        # bone rotation must be pre-multiplied by joint orientation
+        q_list.extend(
+            swap_quat(*(MEulerRotation(rx, ry, rz, rotate_order).asQuaternion() * orientation))
+            for rx, ry, rz in zip(*samples[3:6])
+        )
+        s_list.extend(zip(*samples[6:9]))
+
+    # any remaining bones have to be sampled by stepping through the frame range
+    if scrub_bones:
+        # resolve each bones transform function set, joint orientation and sample lists once, rather than on every
+        # frame, the transforms are then read through the API instead of PyMel
+        scrub_data = [
+            (OpenMayaAPI.MFnTransform(get_dagpath(bone.longName())), MQuaternion(*bone.getOrientation()))
+            + frames_data[bone.name()]
+            for bone in scrub_bones
+        ]
+        k_Transform = OpenMayaAPI.MSpace.kTransform
+        try:
+            cmds.refresh(suspend=True)
+            for f in xrange(startframe, endframe + 1):
+                pmc.currentTime(f, edit=True)
+                for mFn_Xform, orientation, t_list, q_list, s_list in scrub_data:
+                    t_list.append(swap_vec3(*mFn_Xform.translation(k_Transform)))
+                    # bone rotation must be pre-multiplied by joint orientation
+                    q_list.append(swap_quat(*(mFn_Xform.rotation(k_Transform, asQuaternion=True) * orientation)))
+                    s_list.append(tuple(mFn_Xform.scale()))
 
-    finally:
-        cmds.refresh(suspend=False)
-        cmds.refresh(force=True)
+        except Exception as err:
+            IO_PDX_LOG.error(err)
+            raise
+
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.refresh(force=True)
 
     # create an ordered dictionary of all animated bones to store sample data
-    all_bone_keyframes = OrderedDict()
+    all_bone_keyframes = ordered_dict()
     for bone in export_bones:
         all_bone_keyframes[bone.name()] = dict()
 
     # determine if any transform attributes were animated over this frame range for each bone
     for bone in export_bones:
-        # convert data from list of tuples [(t,q,s)] to three nested lists [t][q][s]
-        t_list, q_list, s_list = zip(*frames_data[bone.name()])
+        t_list, q_list, s_list = frames_data[bone.name()]
 
         if round_data:
-            t_list = [util_round(list(t), PDX_ROUND_TRANS) for t in t_list]
-            q_list = [util_round(list(q), PDX_ROUND_ROT) for q in q_list]
-            s_list = [util_round(list(s), PDX_ROUND_SCALE) for s in s_list]
+            t_list = util_round_list(t_list, PDX_ROUND_TRANS)
+            q_list = util_round_list(q_list, PDX_ROUND_ROT)
+            s_list = util_round_list(s_list, PDX_ROUND_SCALE)
 
         # store any animated transform samples per attribute
         for attr, attr_list in zip(["t", "q", "s"], [t_list, q_list, s_list]):
-            if len(set(attr_list)) != 1:
+            if attr_list.count(attr_list[0]) != len(attr_list):
                 all_bone_keyframes[bone.name()][attr] = attr_list
 
     return all_bone_keyframes
@@ -728,11 +900,11 @@ def swap_coord_space(data):
     # matrix
     if type(data) == MMatrix or type(data) == pmdt.Matrix:
         mat = MMatrix(data)
-        return SPACE_MATRIX * mat * SPACE_MATRIX.inverse()
+        return SPACE_MATRIX * mat * SPACE_MATRIX_INV
     # quaternion
     elif type(data) == MQuaternion or type(data) == pmdt.Quaternion:
         mat = MMatrix(data.asMatrix())
-        return MTransformationMatrix(SPACE_MATRIX * mat * SPACE_MATRIX.inverse()).rotation(asQuaternion=True)
+        return MTransformationMatrix(SPACE_MATRIX * mat * SPACE_MATRIX_INV).rotation(asQuaternion=True)
     # vector
     elif type(data) == MVector or type(data) == pmdt.Vector or len(data) == 3:
         vec = MVector(data)
@@ -745,6 +917,40 @@ def swap_coord_space(data):
         raise NotImplementedError("Unknown data type encountered.")
 
 
+# fast paths for bulk vector, quaternion and uv data, these give the same result as swap_coord_space without building an
+# API object and multiplying it through SPACE_MATRIX, the conversion is picked once for the scene up axis
+if maya_up == "z":
+
+    def swap_vec3(x, y, z):
+        return x, z, y
+
+    def swap_quat(x, y, z, w):
+        return -x, -z, -y, w
+
+else:
+
+    def swap_vec3(x, y, z):
+        return x, y, -z
+
+    def swap_quat(x, y, z, w):
+        return -x, -y, z, w
+
+
+def swap_uv(u, v):
+    return u, 1 - v
+
+
+def quat_to_euler(x, y, z, w):
+    """ Converts a unit quaternion to XYZ order euler angles in radians, matching MQuaternion.asEulerRotation(). """
+    # clamp to guard against float error pushing the gimbal lock case outside of asin's domain
+    sin_y = max(-1.0, min(1.0, 2.0 * (w * y - x * z)))
+    return (
+        math.atan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y)),
+        math.asin(sin_y),
+        math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z)),
+    )
+
+
 """ ====================================================================================================================
     Creation functions.
 ========================================================================================================================
@@ -756,24 +962,32 @@ def create_filetexture(tex_filepath):
     newFile = pmc.shadingNode("file", asTexture=True)
     new2dTex = pmc.shadingNode("place2dTexture", asUtility=True)
 
-    pmc.connectAttr(new2dTex.coverage, newFile.coverage)
-    pmc.connectAttr(new2dTex.translateFrame, newFile.translateFrame)
-    pmc.connectAttr(new2dTex.rotateFrame, newFile.rotateFrame)
-    pmc.connectAttr(new2dTex.mirrorU, newFile.mirrorU)
-    pmc.connectAttr(new2dTex.mirrorV, newFile.mirrorV)
-    pmc.connectAttr(new2dTex.stagger, newFile.stagger)
-    pmc.connectAttr(new2dTex.wrapU, newFile.wrapU)
-    pmc.connectAttr(new2dTex.wrapV, newFile.wrapV)
-    pmc.connectAttr(new2dTex.repeatUV, newFile.repeatUV)
-    pmc.connectAttr(new2dTex.offset, newFile.offset)
-    pmc.connectAttr(new2dTex.rotateUV, newFile.rotateUV)
-    pmc.connectAttr(new2dTex.noiseUV, newFile.noiseUV)
-    pmc.connectAttr(new2dTex.vertexUvOne, newFile.vertexUvOne)
-    pmc.connectAttr(new2dTex.vertexUvTwo, newFile.vertexUvTwo)
-    pmc.connectAttr(new2dTex.vertexUvThree, newFile.vertexUvThree)
-    pmc.connectAttr(new2dTex.vertexCameraOne, newFile.vertexCameraOne)
-    pmc.connectAttr(new2dTex.outUV, newFile.uv)
-    pmc.connectAttr(new2dTex.outUvFilterSize, newFile.uvFilterSize)
+    # queue all the place2dTexture connections on one modifier, so they are made in a single operation
+    file_obj = get_MObject(newFile.name())
+    place2d_obj = get_MObject(new2dTex.name())
+    m_DGMod = OpenMaya.MDGModifier()
+    for place2d_attr, file_attr in [
+        ("coverage", "coverage"),
+        ("translateFrame", "translateFrame"),
+        ("rotateFrame", "rotateFrame"),
+        ("mirrorU", "mirrorU"),
+        ("mirrorV", "mirrorV"),
+        ("stagger", "stagger"),
+        ("wrapU", "wrapU"),
+        ("wrapV", "wrapV"),
+        ("repeatUV", "repeatUV"),
+        ("offset", "offset"),
+        ("rotateUV", "rotateUV"),
+        ("noiseUV", "noiseUV"),
+        ("vertexUvOne", "vertexUvOne"),
+        ("vertexUvTwo", "vertexUvTwo"),
+        ("vertexUvThree", "vertexUvThree"),
+        ("vertexCameraOne", "vertexCameraOne"),
+        ("outUV", "uv"),
+        ("outUvFilterSize", "uvFilterSize"),
+    ]:
+        m_DGMod.connect(get_plug(place2d_obj, place2d_attr), get_plug(file_obj, file_attr))
+    m_DGMod.doIt()
     newFile.fileTextureName.set(tex_filepath)
 
     if not os.path.isfile(tex_filepath):
@@ -819,13 +1033,16 @@ def create_material(PDX_material, mesh, texture_folder):
     shader_name = "PDXmat_" + mesh.name()
     shader, s_group = create_shader(PDX_material, shader_name, texture_folder)
 
-    pmc.select(mesh)
     mesh.backfaceCulling.set(1)
-    pmc.hyperShade(assign=s_group)
+    # add the mesh to the shading group directly, rather than selecting it for hyperShade to assign
+    pmc.sets(s_group, edit=True, forceElement=mesh)
+
 
+def create_locator(PDX_locator, PDX_bone_dict, parent_cache=None):
+    """ Creates a Maya Locator object. Optionally takes a dictionary used to cache the inverse transform of missing
+    parent bones, across multiple calls. """
+    parent_cache = {} if parent_cache is None else parent_cache
 
-def create_locator(PDX_locator, PDX_bone_dict):
-    """ Creates a Maya Locator object. """
     # create locator
     new_loc = pmc.spaceLocator()
     pmc.select(new_loc)
@@ -833,7 +1050,7 @@ def create_locator(PDX_locator, PDX_bone_dict):
 
     # check for parent, then parent locator to scene bone, or apply parents transform
     parent = getattr(PDX_locator, "pa", None)
-    parent_Xform = None
+    parent_Xform_inv = None
 
     if parent is not None:
         parent_bone = pmc.ls(parent[0], type="joint")
@@ -841,17 +1058,20 @@ def create_locator(PDX_locator, PDX_bone_dict):
             # parent the locator to a bone in the scene
             pmc.parent(new_loc, parent_bone[0])
         else:  # parent bone doesn't exist in current scene
-            # determine the locators transform
-            if parent[0] in PDX_bone_dict:
+            # determine the locators transform, locators often share a parent so only invert each bone once
+            if parent[0] in parent_cache:
+                parent_Xform_inv = parent_cache[parent[0]]
+            elif parent[0] in PDX_bone_dict:
                 transform = PDX_bone_dict[parent[0]]
                 # fmt: off
-                parent_Xform = pmdt.Matrix(
-                    transform[0], transform[1], transform[2], 0.0,
-                    transform[3], transform[4], transform[5], 0.0,
-                    transform[6], transform[7], transform[8], 0.0,
-                    transform[9], transform[10], transform[11], 1.0,
-                )
+                parent_Xform = MMatrix((
+                    (transform[0], transform[1], transform[2], 0.0),
+                    (transform[3], transform[4], transform[5], 0.0),
+                    (transform[6], transform[7], transform[8], 0.0),
+                    (transform[9], transform[10], transform[11], 1.0),
+                ))
                 # fmt: on
+                parent_Xform_inv = parent_cache[parent[0]] = parent_Xform.inverse()
             else:
                 IO_PDX_LOG.warning(
                     "unable to create locator '{0}' (missing parent '{1}' in file data)".format(
@@ -865,6 +1085,17 @@ def create_locator(PDX_locator, PDX_bone_dict):
     loc_MObj = get_mobject(new_loc.name())
     mFn_Xform = OpenMayaAPI.MFnTransform(loc_MObj)
 
+    # unparented locator with only rotate and translate components, these can be converted to Maya space directly
+    if parent is None and not hasattr(PDX_locator, "tx"):
+        # rotation
+        quat = swap_coord_space(MQuaternion(*PDX_locator.q))
+        mFn_Xform.setRotation(quat, OpenMayaAPI.MSpace.kTransform)
+        # translation
+        vector = swap_coord_space(MVector(PDX_locator.p[0], PDX_locator.p[1], PDX_locator.p[2]))
+        mFn_Xform.setTranslation(vector, OpenMayaAPI.MSpace.kTransform)
+
+        return new_loc
+
     # if full transformation is available, set transformation directly
     if hasattr(PDX_locator, "tx"):
         # fmt: off
@@ -877,21 +1108,22 @@ def create_locator(PDX_locator, PDX_bone_dict):
             ))
         )
         # fmt: on
-        mFn_Xform.setTransformation(loc_Xform)
     # otherwise just rotate and translate components
     else:
+        loc_Xform = MTransformationMatrix()
         # rotation
         quat = MQuaternion(*PDX_locator.q)
-        mFn_Xform.setRotation(quat, OpenMayaAPI.MSpace.kTransform)
+        loc_Xform.setRotation(quat)
         # translation
         vector = MVector(PDX_locator.p[0], PDX_locator.p[1], PDX_locator.p[2])
-        mFn_Xform.setTranslation(vector, OpenMayaAPI.MSpace.kTransform)
+        loc_Xform.setTranslation(vector, OpenMayaAPI.MSpace.kTransform)
 
-    # apply parent transform
-    if parent_Xform is not None:
-        new_loc.setMatrix(new_loc.getMatrix() * parent_Xform.inverse())
+    # apply parent transform and convert to Maya space, composing the matrix off the node and setting it once
+    loc_matrix = loc_Xform.asMatrix()
+    if parent_Xform_inv is not None:
+        loc_matrix = loc_matrix * parent_Xform_inv
 
-    new_loc.setMatrix(swap_coord_space(new_loc.getMatrix()))
+    mFn_Xform.setTransformation(MTransformationMatrix(swap_coord_space(loc_matrix)))
 
     return new_loc
 
@@ -900,6 +1132,11 @@ def create_skeleton(PDX_bone_list):
     # keep track of bones as we create them
     bone_list = [None for _ in xrange(0, len(PDX_bone_list))]
 
+    # count the joints already in the scene by name once, rather than searching the scene again for every bone
+    scene_joints = {}
+    for joint in pmc.ls(type="joint"):
+        scene_joints.setdefault(joint.nodeName(), []).append(joint)
+
     pmc.select(clear=True)
     for bone in PDX_bone_list:
         index = bone.ix[0]
@@ -911,9 +1148,9 @@ def create_skeleton(PDX_bone_list):
         unique_name = clean_imported_name(bone.name)
 
         # check if bone already exists, possible the skeleton is already built so collect and return joints
-        existing_bone = pmc.ls(unique_name, type="joint")
+        existing_bone = scene_joints.get(unique_name, [])
         if len(existing_bone) == 1:
-            bone_list[index] = pmc.PyNode(existing_bone[0])
+            bone_list[index] = existing_bone[0]
             continue
 
         # create joint
@@ -925,12 +1162,12 @@ def create_skeleton(PDX_bone_list):
 
         # set transform
         # fmt: off
-        mat = pmdt.Matrix(
-            transform[0], transform[1], transform[2], 0.0,
-            transform[3], transform[4], transform[5], 0.0,
-            transform[6], transform[7], transform[8], 0.0,
-            transform[9], transform[10], transform[11], 1.0,
-        )
+        mat = MMatrix((
+            (transform[0], transform[1], transform[2], 0.0),
+            (transform[3], transform[4], transform[5], 0.0),
+            (transform[6], transform[7], transform[8], 0.0),
+            (transform[9], transform[10], transform[11], 1.0),
+        ))
         # fmt: on
         new_bone.setMatrix(swap_coord_space(mat.inverse()), worldSpace=True)  # set to matrix inverse in world-space
         pmc.select(clear=True)
@@ -940,9 +1177,11 @@ def create_skeleton(PDX_bone_list):
             parent_bone = bone_list[parent[0]]
             pmc.connectJoint(new_bone, parent_bone, parentMode=True)
 
+    # set joint display and scaling attributes through their plugs directly, rather than one setAttr command each
     for joint in bone_list:
-        joint.radius.set(0.3)
-        joint.segmentScaleCompensate.set(False)
+        jnt_obj = joint.__apimobject__()
+        get_plug(jnt_obj, "radius").setDouble(0.3)
+        get_plug(jnt_obj, "segmentScaleCompensate").setBool(False)
 
     return bone_list
 
@@ -951,17 +1190,9 @@ def create_skin(PDX_skin, mesh, skeleton, max_infs=None):
     if max_infs is None:
         max_infs = PDX_MAXSKININFS
 
-    # create dictionary of skinning info per vertex
-    skin_dict = dict()
-
     num_infs = PDX_skin.bones[0]
-    for vtx in xrange(0, len(PDX_skin.ix) / max_infs):
-        skin_dict[vtx] = dict(joints=[], weights=[])
-
-    # gather joint index and weighting that each vertex is skinned to
-    for vtx, j in enumerate(xrange(0, len(PDX_skin.ix), max_infs)):
-        skin_dict[vtx]["joints"] = PDX_skin.ix[j : j + num_infs]
-        skin_dict[vtx]["weights"] = PDX_skin.w[j : j + num_infs]
+    num_verts = len(PDX_skin.ix) // max_infs
+    num_joints = len(skeleton)
 
     # select mesh and joints
     pmc.select(skeleton, mesh)
@@ -978,34 +1209,57 @@ def create_skin(PDX_skin, mesh, skeleton, max_infs=None):
 
     mesh_dag = get_MDagPath(mesh.name())
 
-    indices = OpenMaya.MIntArray()
-    for vtx in xrange(len(skin_dict.keys())):
-        indices.append(vtx)
+    indices = create_range_array(num_verts)
     mFn_SingleIdxCo = OpenMaya.MFnSingleIndexedComponent()
     vertex_IdxCo = mFn_SingleIdxCo.create(OpenMaya.MFn.kMeshVertComponent)
     mFn_SingleIdxCo.addElements(indices)  # must only add indices after running create()
 
-    infs = OpenMaya.MIntArray()
-    for j in xrange(len(skeleton)):
-        infs.append(j)
-
-    weights = OpenMaya.MDoubleArray()
-    for vtx in xrange(len(skin_dict.keys())):
-        jts = skin_dict[vtx]["joints"]
-        wts = skin_dict[vtx]["weights"]
-        for j in xrange(len(skeleton)):
-            if j in jts:
-                weights.append(wts[jts.index(j)])
-            else:
-                weights.append(0.0)
+    infs = create_range_array(num_joints)
+
+    # dense list of weights per vertex, per joint, only the weights each vertex is skinned with need setting
+    weights = [0.0] * (num_verts * num_joints)
+    for vtx in xrange(num_verts):
+        # gather joint index and weighting that each vertex is skinned to
+        jts = PDX_skin.ix[vtx * max_infs : vtx * max_infs + num_infs]
+        wts = PDX_skin.w[vtx * max_infs : vtx * max_infs + num_infs]
+        # set in reverse so the first weight wins where a joint is listed twice
+        for j, w in reversed(list(zip(jts, wts))):
+            if 0 <= j < num_joints:
+                weights[vtx * num_joints + j] = w
 
     # set skin weights
-    mFn_SkinCluster.setWeights(mesh_dag, vertex_IdxCo, infs, weights)
+    mFn_SkinCluster.setWeights(mesh_dag, vertex_IdxCo, infs, create_double_array(weights))
 
     # turn on skin weights normalization again
     pmc.setAttr("{0}.normalizeWeights".format(skin_cluster), True)
 
 
+def create_range_array(length):
+    """ Returns an integer array of the values 0 to length - 1. """
+    int_array = OpenMaya.MIntArray()
+    OpenMaya.MScriptUtil.createIntArrayFromList(list(xrange(length)), int_array)
+
+    return int_array
+
+
+def create_double_array(values):
+    """ Returns a double array copied from a list of values in a single call, rather than appending each value. """
+    util = OpenMaya.MScriptUtil()
+    util.createFromList(values, len(values))
+
+    return OpenMaya.MDoubleArray(util.asDoublePtr(), len(values))
+
+
+def create_uv_arrays(uv_data):
+    """ Returns arrays of U and V co-ordinates from a flat list of 2d co-ordinates, flipped in V into Maya space. """
+    uArray = OpenMaya.MFloatArray()
+    vArray = OpenMaya.MFloatArray()
+    OpenMaya.MScriptUtil.createFloatArrayFromList(list(uv_data[0::2]), uArray)
+    OpenMaya.MScriptUtil.createFloatArrayFromList([1 - v for v in uv_data[1::2]], vArray)  # flip the UV coords in V!
+
+    return uArray, vArray
+
+
 def create_mesh(PDX_mesh, name=None):
     """ Creates a Maya mesh object. """
     # temporary name used during creation
@@ -1031,36 +1285,28 @@ def create_mesh(PDX_mesh, name=None):
     # build the following arguments for the MFnMesh.create() function
     # numVertices, numPolygons, vertexArray, polygonCounts, polygonConnects, uArray, vArray, new_transform
 
-    # vertices
-    numVertices = 0
+    # vertices (converting to Maya space)
+    numVertices = len(verts) // 3
     vertexArray = OpenMaya.MFloatPointArray()  # array of points
-    for i in xrange(0, len(verts), 3):
-        _verts = swap_coord_space([verts[i], verts[i + 1], verts[i + 2]])
-        v = OpenMaya.MFloatPoint(_verts[0], _verts[1], _verts[2])
-        vertexArray.append(v)
-        numVertices += 1
+    vertexArray.setLength(numVertices)
+    for i, co in enumerate(zip(verts[0::3], verts[1::3], verts[2::3])):
+        vertexArray.set(OpenMaya.MFloatPoint(*swap_vec3(*co)), i)
 
     # faces
-    numPolygons = len(tris) / 3
-    polygonCounts = OpenMaya.MIntArray()  # count of vertices per poly
-    for i in xrange(0, numPolygons):
-        polygonCounts.append(3)
+    numPolygons = len(tris) // 3
+    polygonCounts = OpenMaya.MIntArray(numPolygons, 3)  # count of vertices per poly
 
-    # vert connections
+    # vert connections, reversing the winding of each tri to convert handedness to Maya space
+    tris_flipped = list(tris)
+    tris_flipped[0::3], tris_flipped[2::3] = tris[2::3], tris[0::3]
     polygonConnects = OpenMaya.MIntArray()
-    for i in xrange(0, len(tris), 3):
-        polygonConnects.append(tris[i + 2])  # convert handedness to Maya space
-        polygonConnects.append(tris[i + 1])
-        polygonConnects.append(tris[i])
+    OpenMaya.MScriptUtil.createIntArrayFromList(tris_flipped, polygonConnects)
 
     # default UVs
     uArray = OpenMaya.MFloatArray()
     vArray = OpenMaya.MFloatArray()
     if uv_Ch.get(0):
-        uv_data = uv_Ch[0]
-        for i in xrange(0, len(uv_data), 2):
-            uArray.append(uv_data[i])
-            vArray.append(1 - uv_data[i + 1])  # flip the UV coords in V!
+        uArray, vArray = create_uv_arrays(uv_Ch[0])
 
     """ ================================================================================================================
         Create the new mesh """
@@ -1093,24 +1339,15 @@ def create_mesh(PDX_mesh, name=None):
     # apply the vertex normal data
     if norms:
         normalsIn = OpenMaya.MVectorArray()  # array of vectors
-        for i in xrange(0, len(norms), 3):
-            _norms = swap_coord_space([norms[i], norms[i + 1], norms[i + 2]])  # convert vector to Maya space
-            n = OpenMaya.MVector(_norms[0], _norms[1], _norms[2])
-            normalsIn.append(n)
-        vertexList = OpenMaya.MIntArray()  # matches normal to vert by index
-        for i in xrange(0, numVertices):
-            vertexList.append(i)
+        normalsIn.setLength(len(norms) // 3)
+        for i, nrm in enumerate(zip(norms[0::3], norms[1::3], norms[2::3])):
+            normalsIn.set(OpenMaya.MVector(*swap_vec3(*nrm)), i)  # convert vector to Maya space
+        vertexList = create_range_array(numVertices)  # matches normal to vert by index
         mFn_Mesh.setVertexNormals(normalsIn, vertexList)
 
     # apply the UV data channels
-    uvCounts = OpenMaya.MIntArray()
-    for i in xrange(0, numPolygons):
-        uvCounts.append(3)
-    uvIds = OpenMaya.MIntArray()
-    for i in xrange(0, len(tris), 3):
-        uvIds.append(tris[i + 2])  # convert handedness to Maya space
-        uvIds.append(tris[i + 1])
-        uvIds.append(tris[i])
+    uvCounts = OpenMaya.MIntArray(numPolygons, 3)
+    uvIds = polygonConnects  # each vertex has a single UV, so UV ids match the vertex connections
 
     # note we don't call setUVs before assignUVs for the default UV set, this was done during creation!
     if uv_Ch.get(0):
@@ -1120,14 +1357,8 @@ def create_mesh(PDX_mesh, name=None):
     for idx in uv_Ch:
         # ignore Ch 0 as we have already set this
         if idx != 0:
-            uv_data = uv_Ch[idx]
             uvSetName = "map" + str(idx + 1)
-
-            uArray = OpenMaya.MFloatArray()
-            vArray = OpenMaya.MFloatArray()
-            for i in xrange(0, len(uv_data), 2):
-                uArray.append(uv_data[i])
-                vArray.append(1 - uv_data[i + 1])  # flip the UV coords in V!
+            uArray, vArray = create_uv_arrays(uv_Ch[idx])
 
             mFn_Mesh.createUVSetWithName(uvSetName)
             mFn_Mesh.setUVs(uArray, vArray, uvSetName)
@@ -1177,93 +1408,55 @@ def create_animcurve(joint, attr):
     return anim_curve, mFn_AnimCurve
 
 
-def create_anim_keys(joint_name, key_dict, timestart):
-    jnt_obj = get_MObject(joint_name)
+def create_time_array(timestart, timeend):
+    """ Returns an array of times for each frame from the start frame, up to but not including the end frame. """
+    time_unit = OpenMaya.MTime.uiUnit()
+    time_array = OpenMaya.MTimeArray()
+    for t in xrange(int(timestart), int(timeend)):
+        time_array.append(OpenMaya.MTime(t, time_unit))
 
-    # calculate start and end frames
-    timestart = int(timestart)
-    timeend = timestart + len(max(key_dict.values(), key=len))
+    return time_array
 
-    # create a time array
-    time_array = OpenMaya.MTimeArray()
-    for t in xrange(timestart, timeend):
-        time_array.append(OpenMaya.MTime(t, OpenMaya.MTime.uiUnit()))
+
+def create_anim_keys(joint_name, key_dict, timestart, time_array=None):
+    jnt_obj = get_MObject(joint_name)
+
+    # create a time array, unless we were given one shared across all joints
+    if time_array is None:
+        timestart = int(timestart)
+        timeend = timestart + len(max(key_dict.values(), key=len))
+        time_array = create_time_array(timestart, timeend)
 
     # define anim curve tangent
     k_Tangent = OpenMayaAnim.MFnAnimCurve.kTangentLinear
 
     if "s" in key_dict:  # scale data
-        animated_attrs = dict(scaleX=None, scaleY=None, scaleZ=None)
+        # PDX animation scale is uniform, so the same keys are used for all three axes
+        scale_data = create_double_array([_scale[0] for _scale in key_dict["s"]])
 
-        for attrib in animated_attrs:
-            # create the curve and API function set
+        # create the curves and add keys
+        for attrib in ["scaleX", "scaleY", "scaleZ"]:
             anim_curve, mFn_AnimCurve = create_animcurve(jnt_obj, attrib)
-            animated_attrs[attrib] = mFn_AnimCurve
-
-        # create data arrays per animating attribute
-        x_scale_data = OpenMaya.MDoubleArray()
-        y_scale_data = OpenMaya.MDoubleArray()
-        z_scale_data = OpenMaya.MDoubleArray()
-
-        for scale_data in key_dict["s"]:
-            x_scale_data.append(scale_data[0])
-            y_scale_data.append(scale_data[0])
-            z_scale_data.append(scale_data[0])
-
-        # add keys to the new curves
-        for attrib, data_array in zip(animated_attrs, [x_scale_data, y_scale_data, z_scale_data]):
-            mFn_AnimCurve = animated_attrs[attrib]
-            mFn_AnimCurve.addKeys(time_array, data_array, k_Tangent, k_Tangent)
+            mFn_AnimCurve.addKeys(time_array, scale_data, k_Tangent, k_Tangent)
 
     if "q" in key_dict:  # quaternion data
-        animated_attrs = dict(rotateX=None, rotateY=None, rotateZ=None)
+        # convert from quaternion to euler, this gives values in radians (which Maya uses internally)
+        euler_data = [quat_to_euler(*swap_quat(*quat_data)) for quat_data in key_dict["q"]]
 
-        for attrib in animated_attrs:
-            # create the curve and API function set
+        # create the curves and add keys, with one data array per animating attribute
+        rot_attribs = ["rotateX", "rotateY", "rotateZ"]
+        for attrib, axis_data in zip(rot_attribs, zip(*euler_data)):
             anim_curve, mFn_AnimCurve = create_animcurve(jnt_obj, attrib)
-            animated_attrs[attrib] = mFn_AnimCurve
-
-        # create data arrays per animating attribute
-        x_rot_data = OpenMaya.MDoubleArray()
-        y_rot_data = OpenMaya.MDoubleArray()
-        z_rot_data = OpenMaya.MDoubleArray()
-
-        for quat_data in key_dict["q"]:
-            q = swap_coord_space(MQuaternion(*quat_data))
-            # convert from quaternion to euler, this gives values in radians (which Maya uses internally)
-            euler_data = q.asEulerRotation()
-            x_rot_data.append(euler_data.x)
-            y_rot_data.append(euler_data.y)
-            z_rot_data.append(euler_data.z)
-
-        # add keys to the new curves
-        for attrib, data_array in zip(animated_attrs, [x_rot_data, y_rot_data, z_rot_data]):
-            mFn_AnimCurve = animated_attrs[attrib]
-            mFn_AnimCurve.addKeys(time_array, data_array, k_Tangent, k_Tangent)
+            mFn_AnimCurve.addKeys(time_array, create_double_array(list(axis_data)), k_Tangent, k_Tangent)
 
     if "t" in key_dict:  # translation data
-        animated_attrs = dict(translateX=None, translateY=None, translateZ=None)
+        trans_data = [swap_vec3(*_trans) for _trans in key_dict["t"]]
 
-        for attrib in animated_attrs:
-            # create the curve and API function set
+        # create the curves and add keys, with one data array per animating attribute
+        trans_attribs = ["translateX", "translateY", "translateZ"]
+        for attrib, axis_data in zip(trans_attribs, zip(*trans_data)):
             anim_curve, mFn_AnimCurve = create_animcurve(jnt_obj, attrib)
-            animated_attrs[attrib] = mFn_AnimCurve
-
-        # create data arrays per animating attribute
-        x_trans_data = OpenMaya.MDoubleArray()
-        y_trans_data = OpenMaya.MDoubleArray()
-        z_trans_data = OpenMaya.MDoubleArray()
-
-        for trans_data in key_dict["t"]:
-            t = swap_coord_space(MVector(*trans_data))
-            x_trans_data.append(t[0])
-            y_trans_data.append(t[1])
-            z_trans_data.append(t[2])
-
-        # add keys to the new curves
-        for attrib, data_array in zip(animated_attrs, [x_trans_data, y_trans_data, z_trans_data]):
-            mFn_AnimCurve = animated_attrs[attrib]
-            mFn_AnimCurve.addKeys(time_array, data_array, k_Tangent, k_Tangent)
+            mFn_AnimCurve.addKeys(time_array, create_double_array(list(axis_data)), k_Tangent, k_Tangent)
 
 
 """ ====================================================================================================================
@@ -1313,6 +1506,7 @@ def import_meshfile(meshpath, imp_mesh=True, imp_skel=True, imp_locs=True, join_
         meshes = node.findall("mesh")
         if imp_mesh and meshes:
             created = []
+            skinned = False
             for mat_idx, m in enumerate(meshes):
                 IO_PDX_LOG.info("creating mesh - {0}".format(mat_idx))
                 progress.update(1, "creating mesh")
@@ -1342,29 +1536,36 @@ def import_meshfile(meshpath, imp_mesh=True, imp_skel=True, imp_locs=True, join_
                     IO_PDX_LOG.info("creating skinning data -")
                     progress.update(1, "creating skinning data")
                     create_skin(pdx_skin, mesh, joints)
+                    skinned = True
 
             if join_materials and len(created) > 1:
                 name = created[0].name()
-                print(name)
-                try:
-                    joined_mesh = pmc.polyUniteSkinned(*created, constructionHistory=False, mergeUVSets=1)[0]
-                except RuntimeError:  # Maya raises this when using polyUniteSkinned on a group of unskinned meshes
+                joined_mesh = None
+                # only attempt a skinned unite when we actually skinned something, rather than waiting for it to fail
+                if skinned:
+                    try:
+                        joined_mesh = pmc.polyUniteSkinned(*created, constructionHistory=False, mergeUVSets=1)[0]
+                    except RuntimeError:  # Maya raises this when using polyUniteSkinned on a group of unskinned meshes
+                        pass
+                if joined_mesh is None:
                     joined_mesh = pmc.polyUnite(*created, constructionHistory=False, mergeUVSets=1)[0]
                 pmc.rename(joined_mesh, name)
 
     # go through locators
     if imp_locs and locators:
         progress.update(1, "creating locators")
+        parent_cache = {}
         for i, loc in enumerate(locators):
             IO_PDX_LOG.info("creating locator {0}/{1} - {2}".format(i + 1, len(locators), loc.tag))
             pdx_locator = pdx_data.PDXData(loc)
-            obj = create_locator(pdx_locator, complete_bone_dict)
+            obj = create_locator(pdx_locator, complete_bone_dict, parent_cache)
 
     pmc.select(None)
     IO_PDX_LOG.info("import finished! ({0:.4f} sec)".format(time.time() - start))
     progress.finished()
 
 
+@cache_skeleton_hierarchy
 def export_meshfile(
     meshpath, exp_mesh=True, exp_skel=True, exp_locs=True, split_verts=False, exp_selected=False, **kwargs
 ):
@@ -1386,18 +1587,17 @@ def export_meshfile(
         maya_meshes = list_scene_pdx_meshes()
         # optionally intersect with selection
         if exp_selected:
-            current_selection = pmc.selected()
-            maya_meshes = [
-                shape
-                for shape in maya_meshes
-                if pmc.listRelatives(shape, parent=True, type="transform")[0] in current_selection
-            ]
+            current_selection = set(pmc.selected())
+            maya_meshes = [shape for shape in maya_meshes if shape.getParent() in current_selection]
 
         if len(maya_meshes) == 0:
             raise RuntimeError("Mesh export is selected, but found no meshes with PDX materials applied.")
 
         # sort meshes for export by index
-        maya_meshes.sort(key=lambda mesh: get_mesh_index(mesh))
+        maya_meshes.sort(key=get_mesh_index)
+
+        # skin weights are read per shape, but exported per material
+        skin_cache = {}
 
         for shape in maya_meshes:
             # create parent element for node data, if exporting meshes
@@ -1451,7 +1651,7 @@ def export_meshfile(
                     materialnode_xml.set(slot, [os.path.split(texture)[1]])
 
                 # create parent element for skin data, if the mesh is skinned
-                skin_info_dict = get_mesh_skin_info(shape, vert_ids)
+                skin_info_dict = get_mesh_skin_info(shape, vert_ids, skin_cache)
                 if exp_skel and skin_info_dict:
                     IO_PDX_LOG.info("writing skinning data -")
                     progress.update(1, "writing skinning data")
@@ -1508,7 +1708,9 @@ def export_meshfile(
 
     # create root element for locators
     locator_xml = Xml.SubElement(root_xml, "locator")
-    maya_locators = [pmc.listRelatives(loc, parent=True, type="transform")[0] for loc in pmc.ls(type=pmc.nt.Locator)]
+    # query the parent transforms of all locator shapes at once (an empty query would act on the selection instead)
+    maya_loc_shapes = pmc.ls(type=pmc.nt.Locator)
+    maya_locators = pmc.listRelatives(maya_loc_shapes, parent=True, type="transform") if maya_loc_shapes else []
     loc_info_list = get_locators_info(maya_locators)
 
     if exp_locs and loc_info_list:
@@ -1543,6 +1745,7 @@ def import_animfile(animpath, frame_start=1, **kwargs):
     info = asset_elem.find("info")
     samples = asset_elem.find("samples")
     framecount = info.attrib["sa"][0]
+    frame_end = frame_start + framecount - 1
 
     # set scene animation and playback settings
     fps = int(info.attrib["fps"][0])
@@ -1559,25 +1762,33 @@ def import_animfile(animpath, frame_start=1, **kwargs):
         else:
             raise RuntimeError("Unsupported animation speed. ({0} fps)".format(fps))
 
-    progress.update(1, "setting playback speed")
-    pmc.playbackOptions(edit=True, playbackSpeed=1.0)
-    pmc.playbackOptions(edit=True, animationStartTime=0.0)
-
-    IO_PDX_LOG.info("setting playback range - ({0},{1})".format(frame_start, (frame_start + framecount - 1)))
-    progress.update(1, "setting playback range")
-    pmc.playbackOptions(edit=True, minTime=frame_start)
-    pmc.playbackOptions(edit=True, maxTime=(frame_start + framecount - 1))
+    IO_PDX_LOG.info("setting playback range - ({0},{1})".format(frame_start, frame_end))
+    progress.update(1, "setting playback speed and range")
+    pmc.playbackOptions(edit=True, playbackSpeed=1.0, animationStartTime=0.0, minTime=frame_start, maxTime=frame_end)
 
     pmc.currentTime(frame_start, edit=True)
 
-    # find bones being animated in the scene
+    # find bones being animated in the scene, in the same pass check which transform types are animated on each bone
+    # and where each bones samples sit within a frame
     IO_PDX_LOG.info("finding bones -")
     progress.update(1, "finding bones")
     bone_errors = []
     bone_list = []
+    bone_long_names = dict()
+    all_bone_keyframes = ordered_dict()
+    sample_offsets = dict()
+    sample_widths = dict(s=1, q=4, t=3)
+    frame_strides = dict(s=0, q=0, t=0)
     for bone in info:
         bone_joint = None
         bone_name = clean_imported_name(bone.tag)
+
+        all_bone_keyframes[bone_name] = dict()
+        sample_offsets[bone_name] = offsets = dict()
+        for sample_type in bone.attrib["sa"][0]:
+            offsets[sample_type] = frame_strides[sample_type]
+            frame_strides[sample_type] += sample_widths[sample_type]
+
         try:
             matching_bones = pmc.ls(bone_name, type=pmc.nt.Joint, long=True)  # type: pmc.nodetypes.joint
             bone_joint = matching_bones[0]
@@ -1589,7 +1800,8 @@ def import_animfile(animpath, frame_start=1, **kwargs):
         # set initial transform and remove any joint orientation (this is baked into rotation values in the .anim file)
         if bone_joint:
             # compose transform parts
-            _scale = [bone.attrib["s"][0], bone.attrib["s"][0], bone.attrib["s"][0]]
+            _uniform_scale = bone.attrib["s"][0]
+            _scale = (_uniform_scale, _uniform_scale, _uniform_scale)
             _rotation = MQuaternion(*bone.attrib["q"])
             _translation = MVector(*bone.attrib["t"])
 
@@ -1601,54 +1813,49 @@ def import_animfile(animpath, frame_start=1, **kwargs):
             bone_joint.jointOrient.set(0.0, 0.0, 0.0)
 
             bone_list.append(bone_joint)
+            bone_long_names[bone_name] = bone_joint.longName()
 
     # break on bone errors
     if bone_errors:
         raise RuntimeError("Missing bones required for animation:\n{0}".format(bone_errors))
 
-    # check which transform types are animated on each bone
-    all_bone_keyframes = OrderedDict()
-    for bone in info:
-        bone_name = clean_imported_name(bone.tag)
-        key_data = dict()
-        all_bone_keyframes[bone_name] = key_data
+    # then slice the samples data to store keys per bone, every frame holds the same samples so each bones values are
+    # found at a fixed stride through the data, taking one strided slice per component rather than walking every frame
+    for bone_name, bone_key_data in all_bone_keyframes.items():
+        for sample_type, offset in sample_offsets[bone_name].items():
+            data = samples.attrib[sample_type]
+            stride = frame_strides[sample_type]
+            components = [data[offset + i :: stride] for i in xrange(sample_widths[sample_type])]
+            bone_key_data[sample_type] = list(zip(*components))
 
-        for sample_type in bone.attrib["sa"][0]:
-            key_data[sample_type] = []
+    # every bone is keyed over the same frame range, so share one time array
+    time_array = create_time_array(frame_start, frame_end + 1)
 
-    # then traverse the samples data to store keys per bone
-    s_index, q_index, t_index = 0, 0, 0
-    for _ in xrange(0, framecount):
+    # suspend viewport refresh while keying, so the scene is not redrawn as every new curve is connected
+    try:
+        cmds.refresh(suspend=True)
         for bone_name in all_bone_keyframes:
-            bone_key_data = all_bone_keyframes[bone_name]
-
-            if "s" in bone_key_data:
-                bone_key_data["s"].append(samples.attrib["s"][s_index : s_index + 1])
-                s_index += 1
-            if "q" in bone_key_data:
-                bone_key_data["q"].append(samples.attrib["q"][q_index : q_index + 4])
-                q_index += 4
-            if "t" in bone_key_data:
-                bone_key_data["t"].append(samples.attrib["t"][t_index : t_index + 3])
-                t_index += 3
-
-    for bone_name in all_bone_keyframes:
-        bone_keys = all_bone_keyframes[bone_name]
-        # check bone has keyframe values
-        if bone_keys.values():
-            IO_PDX_LOG.info("setting {0} keyframes on bone '{1}'".format(list(bone_keys.keys()), bone_name))
-            progress.update(1, "setting keyframes on bone")
-            bone_long_name = pmc.ls(bone_name, type=pmc.nt.Joint, long=True)[0].name()
-            create_anim_keys(bone_long_name, bone_keys, frame_start)
+            bone_keys = all_bone_keyframes[bone_name]
+            # check bone has keyframe values
+            if bone_keys.values():
+                if IO_PDX_LOG.isEnabledFor(logging.INFO):
+                    IO_PDX_LOG.info("setting {0} keyframes on bone '{1}'".format(list(bone_keys.keys()), bone_name))
+                progress.update(1, "setting keyframes on bone")
+                create_anim_keys(bone_long_names[bone_name], bone_keys, frame_start, time_array=time_array)
+
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.refresh(force=True)
 
     animation_name = os.path.split(os.path.splitext(animpath)[0])[1]
-    edit_animation_clip(bone_list, animation_name, frame_start, (frame_start + framecount - 1))
+    edit_animation_clip(bone_list, animation_name, frame_start, frame_end)
 
     pmc.select(None)
     IO_PDX_LOG.info("import finished! ({0:.4f} sec)".format(time.time() - start))
     progress.finished()
 
 
+@cache_skeleton_hierarchy
 def export_animfile(animpath, frame_start=1, frame_end=10, **kwargs):
     start = time.time()
     IO_PDX_LOG.info("exporting {0}".format(animpath))
@@ -1684,7 +1891,7 @@ def export_animfile(animpath, frame_start=1, frame_end=10, **kwargs):
     # find the scene root bone with animation property (assume this is unique)
     root_bone = None
 
-    pdx_scene_rootbones = [bone for bone in list_scene_rootbones() if hasattr(bone, PDX_ANIMATION)]
+    pdx_scene_rootbones = list_scene_rootbones(attribute=PDX_ANIMATION)
     if len(pdx_scene_rootbones) == 1:
         root_bone = pdx_scene_rootbones[0]
     else:
@@ -1715,41 +1922,41 @@ def export_animfile(animpath, frame_start=1, frame_end=10, **kwargs):
         bone_name = bone.name()
         bone_xml = Xml.SubElement(info_xml, bone_name)
 
-        # check sample types
-        sample_types = ""
-        for attr in ["t", "q", "s"]:
-            if attr in all_bone_keyframes[bone_name]:
-                sample_types += attr
+        # check sample types, these are always listed in the same order
+        bone_keys = all_bone_keyframes[bone_name]
+        sample_types = "".join(attr for attr in "tqs" if attr in bone_keys)
         bone_xml.set("sa", [sample_types])
 
-        _translation = swap_coord_space(bone.getTranslation())
+        _translation = swap_vec3(*bone.getTranslation())
         # bone rotation must be pre-multiplied by joint orientation
-        _rotation = swap_coord_space(bone.getRotation(quaternion=True) * bone.getOrientation())
+        _rotation = swap_quat(*(bone.getRotation(quaternion=True) * bone.getOrientation()))
         _scale = [bone.getScale()[0]]  # animation supports uniform scale only
 
-        bone_xml.set("t", util_round(list(_translation), PDX_ROUND_TRANS))
-        bone_xml.set("q", util_round(list(_rotation), PDX_ROUND_ROT))
-        bone_xml.set("s", util_round(list(_scale), PDX_ROUND_SCALE))
+        bone_xml.set("t", util_round(_translation, PDX_ROUND_TRANS))
+        bone_xml.set("q", util_round(_rotation, PDX_ROUND_ROT))
+        bone_xml.set("s", util_round(_scale, PDX_ROUND_SCALE))
 
     # create root element for animation keyframe data
     samples_xml = Xml.SubElement(root_xml, "samples")
     IO_PDX_LOG.info("writing keyframes -")
     progress.update(1, "writing keyframes")
-    for bone_name in all_bone_keyframes:
-        bone_keys = all_bone_keyframes[bone_name]
-        if bone_keys:
-            IO_PDX_LOG.info("writing {0} keyframes for bone '{1}'".format(list(bone_keys.keys()), bone_name))
-
-    # pack all scene animation data into flat keyframe lists
-    t_packed, q_packed, s_packed = [], [], []
-    for i in xrange(frame_samples):
-        for bone in all_bone_keyframes:
-            if "t" in all_bone_keyframes[bone]:
-                t_packed.extend(all_bone_keyframes[bone]["t"].pop(0))
-            if "q" in all_bone_keyframes[bone]:
-                q_packed.extend(all_bone_keyframes[bone]["q"].pop(0))
-            if "s" in all_bone_keyframes[bone]:
-                s_packed.append(all_bone_keyframes[bone]["s"].pop(0)[0])  # support uniform scale only
+    # this loop only logs, so skip it entirely when the message would be discarded
+    if IO_PDX_LOG.isEnabledFor(logging.INFO):
+        for bone_name in all_bone_keyframes:
+            bone_keys = all_bone_keyframes[bone_name]
+            if bone_keys:
+                IO_PDX_LOG.info("writing {0} keyframes for bone '{1}'".format(list(bone_keys.keys()), bone_name))
+
+    # pack all scene animation data into flat keyframe lists, this transposes the per bone lists of keys into frames
+    # of keys for every animated bone, then flattens the frames in order
+    t_keys = [bone_keys["t"] for bone_keys in all_bone_keyframes.values() if "t" in bone_keys]
+    q_keys = [bone_keys["q"] for bone_keys in all_bone_keyframes.values() if "q" in bone_keys]
+    s_keys = [bone_keys["s"] for bone_keys in all_bone_keyframes.values() if "s" in bone_keys]
+
+    # these are filled straight into typed float arrays, which are written to file without being checked or copied again
+    t_packed = array(str("f"), (value for frame in zip(*t_keys) for key in frame for value in key))
+    q_packed = array(str("f"), (value for frame in zip(*q_keys) for key in frame for value in key))
+    s_packed = array(str("f"), (key[0] for frame in zip(*s_keys) for key in frame))  # support uniform scale only
 
     if t_packed:
         samples_xml.set("t", t_packed)
@@ -8,11 +8,17 @@ from __future__ import print_function, unicode_literals
 
 import os
 import sys
+import time
 import webbrowser
-from imp import reload
 from textwrap import wrap
 from functools import partial
 
+# Py2, Py3 compatibility (imp is deprecated in Py3, Py2 has reload as a builtin)
+try:
+    from importlib import reload
+except ImportError:
+    pass
+
 import pymel.core as pmc
 import maya.OpenMayaUI as OpenMayaUI
 
@@ -71,6 +77,10 @@ def get_maya_mainWindow():
     return wrapInstance(long(pointer), QtWidgets.QMainWindow)
 
 
+# icons by resource name, many buttons share the same icon so each is only loaded once
+_icon_cache = {}
+
+
 def set_widget_icon(widget, icon_name):
     """ to visually browse for Mayas internal icon set
             import maya.app.general.resourceBrowser as resourceBrowser
@@ -79,15 +89,18 @@ def set_widget_icon(widget, icon_name):
         generate the full list with
             cmds.resourceManager()
     """
-    try:
-        widget.setIcon(QtGui.QIcon(":/{0}".format(icon_name)))
-    except Exception as err:
-        IO_PDX_LOG.error(err)
+    icon = _icon_cache.get(icon_name)
+    if icon is None:
+        icon = _icon_cache[icon_name] = QtGui.QIcon(":/{0}".format(icon_name))
+        if icon.isNull():
+            IO_PDX_LOG.warning("Missing icon resource: '{0}'".format(icon_name))
+    widget.setIcon(icon)
 
 
 def move_dialog_onscreen(dialog):
-    QtCore.QCoreApplication.processEvents()
-    screen = QtWidgets.QDesktopWidget().availableGeometry(dialog)
+    # only this dialogs style needs to be current to read its geometry, not the whole application event queue
+    dialog.ensurePolished()
+    screen = QtWidgets.QApplication.desktop().availableGeometry(dialog)
     frame = dialog.frameGeometry()
     if not screen.contains(frame, proper=True):
         x_pos, y_pos = frame.x(), frame.y()
@@ -109,6 +122,20 @@ def move_dialog_onscreen(dialog):
             dialog.move(x_pos, y_pos)
 
 
+def center_on_parent(widget):
+    """ Sizes the widget to its contents and centers it over its parent, keeping it onscreen. """
+    widget.adjustSize()
+    parent = widget.parentWidget()
+    if parent is not None:
+        widget.setGeometry(
+            QtWidgets.QStyle.alignedRect(
+                QtCore.Qt.LeftToRight, QtCore.Qt.AlignCenter, widget.size(), parent.frameGeometry()
+            )
+        )
+
+    move_dialog_onscreen(widget)
+
+
 def HLine():
     line = QtWidgets.QFrame()
     line.setFrameShape(QtWidgets.QFrame.HLine)
@@ -123,35 +150,54 @@ def VLine():
     return line
 
 
+# panel stylesheets, shared by every instance rather than being rebuilt for each one
+COLLAPSING_GROUPBOX_STYLE = (
+    "QGroupBox {"
+    "border: 1px solid;"
+    "border-color: rgba(0, 0, 0, 64);"
+    "border-radius: 6px;"
+    "background-color: rgb(78, 80, 82);"
+    "font-weight: bold;"
+    "}"
+    "QGroupBox::title {"
+    "subcontrol-origin: margin;"
+    "left: 6px;"
+    "top: 4px;"
+    "}"
+    "QGroupBox::indicator:checked {"
+    "image: url(:/arrowDown.png);"
+    "}"
+    "QGroupBox::indicator:unchecked {"
+    "image: url(:/arrowRight.png);"
+    "}"
+)
+FILE_OPTIONS_STYLE = (
+    "QGroupBox {"
+    "border: 1px solid;"
+    "border-color: rgba(0, 0, 0, 64);"
+    "border-radius: 6px;"
+    "background-color: rgb(78, 80, 82);"
+    "}"
+    "QGroupBox::title {"
+    "subcontrol-origin: margin;"
+    "left: 6px;"
+    "top: 4px;"
+    "}"
+)
+
+
 class CollapsingGroupBox(QtWidgets.QGroupBox):
-    def __init__(self, title, parent=None, layout=None, **kwargs):
+    def __init__(self, title, parent=None, layout=None, populate=None, **kwargs):
         super(CollapsingGroupBox, self).__init__(title, parent, **kwargs)
         self.parent = parent
         self.line = HLine()
+        # optional callback that fills the inner layout, deferred until the panel is first expanded
+        self._populate = populate
 
         self.setCheckable(True)
         self.setChecked(True)
         self.setFlat(True)
-        self.setStyleSheet(
-            "QGroupBox {"
-            "border: 1px solid;"
-            "border-color: rgba(0, 0, 0, 64);"
-            "border-radius: 6px;"
-            "background-color: rgb(78, 80, 82);"
-            "font-weight: bold;"
-            "}"
-            "QGroupBox::title {"
-            "subcontrol-origin: margin;"
-            "left: 6px;"
-            "top: 4px;"
-            "}"
-            "QGroupBox::indicator:checked {"
-            "image: url(:/arrowDown.png);"
-            "}"
-            "QGroupBox::indicator:unchecked {"
-            "image: url(:/arrowRight.png);"
-            "}"
-        )
+        self.setStyleSheet(COLLAPSING_GROUPBOX_STYLE)
 
         # setup inner widget, defaulting to grid layout
         self.inner = QtWidgets.QWidget(self.parent)
@@ -166,9 +212,14 @@ class CollapsingGroupBox(QtWidgets.QGroupBox):
         self.layout().addWidget(self.inner)
 
         # configure checkable groupbox as show/hide panel
+        self._resize_pending = False
         self.toggled.connect(self.on_toggle)
 
-    def on_toggle(self, state):
+    def set_expanded(self, state):
+        """ Shows or hides the panel contents without resizing the parent. """
+        if state and self._populate is not None:
+            populate, self._populate = self._populate, None
+            populate(self.inner.layout())
         self.inner.setVisible(state)
         self.line.setVisible(state)
         if state:
@@ -176,7 +227,16 @@ class CollapsingGroupBox(QtWidgets.QGroupBox):
         else:
             self.layout().setContentsMargins(4, 0, 4, 4)
 
-        QtCore.QCoreApplication.processEvents()
+    def on_toggle(self, state):
+        self.set_expanded(state)
+
+        # resize the parent once pending layout events have been processed, several toggles in a row only resize once
+        if not self._resize_pending:
+            self._resize_pending = True
+            QtCore.QTimer.singleShot(0, self.resize_parent)
+
+    def resize_parent(self):
+        self._resize_pending = False
         self.parent.resize(self.parent.layout().sizeHint())
 
     def sizeHint(self):
@@ -186,6 +246,23 @@ class CollapsingGroupBox(QtWidgets.QGroupBox):
             return self.layout().sizeHint()
 
 
+class LazyComboBox(QtWidgets.QComboBox):
+    def __init__(self, get_items, parent=None, **kwargs):
+        super(LazyComboBox, self).__init__(parent, **kwargs)
+        # callback returning the item texts, deferred until the dropdown is first opened
+        self._get_items = get_items
+        self.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon)
+
+    def showPopup(self):
+        if self._get_items is not None:
+            get_items, self._get_items = self._get_items, None
+            self.blockSignals(True)
+            self.addItems(get_items())
+            self.setCurrentIndex(-1)
+            self.blockSignals(False)
+        super(LazyComboBox, self).showPopup()
+
+
 class CustomFileDialog(QtWidgets.QFileDialog):
     def __init__(self, *args, **kwargs):
         super(CustomFileDialog, self).__init__(*args, **kwargs)
@@ -202,30 +279,24 @@ class CustomFileDialog(QtWidgets.QFileDialog):
         self.layout().addWidget(VLine(), 0, 3, 4, 1)
         self.layout().addLayout(box, 0, 4, 4, 1)
 
+    # getter for the value of each type of option control
+    option_getters = {
+        QtWidgets.QLineEdit: QtWidgets.QLineEdit.text,
+        QtWidgets.QComboBox: QtWidgets.QComboBox.currentText,
+        QtWidgets.QCheckBox: QtWidgets.QCheckBox.isChecked,
+        QtWidgets.QSpinBox: QtWidgets.QSpinBox.value,
+    }
+
     def selectedOptions(self):
-        def widget_values(widget):
-            ctrl_values = {}
-            for ctrl in widget.children():
-                name = ctrl.objectName()
-                value = None
-                if isinstance(ctrl, QtWidgets.QLineEdit):
-                    value = ctrl.text()
-                elif isinstance(ctrl, QtWidgets.QComboBox):
-                    value = ctrl.currentText()
-                elif isinstance(ctrl, QtWidgets.QCheckBox):
-                    value = ctrl.isChecked()
-                elif isinstance(ctrl, QtWidgets.QSpinBox):
-                    value = ctrl.value()
-
-                # store this controls value against its identifier
-                if name is not None and value is not None:
-                    ctrl_values[name] = value
-                # check all children of this control
-                ctrl_values.update(widget_values(ctrl))
-
-            return ctrl_values
-
-        options = widget_values(self.optionsWidget)
+        options = {}
+
+        # Qt collects every descendant control in one recursive search, then look up how to read each one by type
+        for ctrl in self.optionsWidget.findChildren(QtWidgets.QWidget):
+            getter = self.option_getters.get(type(ctrl))
+            name = ctrl.objectName()
+            # store this controls value against its identifier
+            if getter is not None and name:
+                options[name] = getter(ctrl)
 
         return options
 
@@ -245,19 +316,7 @@ class CustomFileOptions(QtWidgets.QGroupBox):
         self.setLayout(QtWidgets.QVBoxLayout())
         self.layout().setContentsMargins(8, 22, 8, 8)
         self.layout().setSpacing(8)
-        self.setStyleSheet(
-            "QGroupBox {"
-            "border: 1px solid;"
-            "border-color: rgba(0, 0, 0, 64);"
-            "border-radius: 6px;"
-            "background-color: rgb(78, 80, 82);"
-            "}"
-            "QGroupBox::title {"
-            "subcontrol-origin: margin;"
-            "left: 6px;"
-            "top: 4px;"
-            "}"
-        )
+        self.setStyleSheet(FILE_OPTIONS_STYLE)
 
 
 """ ====================================================================================================================
@@ -267,6 +326,11 @@ class CustomFileOptions(QtWidgets.QGroupBox):
 
 
 class PDX_UI(QtWidgets.QDialog):
+    # release notes wrapped to fit the update popup, by notes text
+    wrapped_notes = {}
+    # emitted from the updaters background thread, Qt queues the connected slot to run on the main thread
+    update_checked = QtCore.Signal()
+
     def __init__(self, parent=None):
         # parent to the Maya main window.
         parent = parent or get_maya_mainWindow()
@@ -274,6 +338,12 @@ class PDX_UI(QtWidgets.QDialog):
         super(PDX_UI, self).__init__(parent)
         self.popup = None  # type: QtWidgets.QWidget
         self.settings = None  # type: QtCore.QSettings
+
+        # the update check may still be running, so add the update controls whenever it completes
+        self.update_checked.connect(self.create_update_controls)
+        self.on_update_checked = self.update_checked.emit
+        github.on_checked.append(self.on_update_checked)
+
         self.create_ui()
 
     def create_ui(self):
@@ -291,6 +361,7 @@ class PDX_UI(QtWidgets.QDialog):
         # File panel
         grp_File = CollapsingGroupBox("File", self)
         grp_File.setObjectName("grpFile")
+        file_layout = grp_File.inner.layout()
 
         lbl_Import = QtWidgets.QLabel("Import:", self)
         self.mesh_import = btn_ImportMesh = QtWidgets.QPushButton("Load mesh ...", self)
@@ -303,16 +374,17 @@ class PDX_UI(QtWidgets.QDialog):
         self.anim_export = btn_ExportAnim = QtWidgets.QPushButton("Save anim ...", self)
         set_widget_icon(btn_ExportAnim, "out_renderLayer.png")
 
-        grp_File.inner.layout().addWidget(lbl_Import, 0, 0, 1, 2)
-        grp_File.inner.layout().addWidget(btn_ImportMesh, 1, 0)
-        grp_File.inner.layout().addWidget(btn_ImportAnim, 1, 1)
-        grp_File.inner.layout().addWidget(lbl_Export, 2, 0, 1, 2)
-        grp_File.inner.layout().addWidget(btn_ExportMesh, 3, 0)
-        grp_File.inner.layout().addWidget(btn_ExportAnim, 3, 1)
+        file_layout.addWidget(lbl_Import, 0, 0, 1, 2)
+        file_layout.addWidget(btn_ImportMesh, 1, 0)
+        file_layout.addWidget(btn_ImportAnim, 1, 1)
+        file_layout.addWidget(lbl_Export, 2, 0, 1, 2)
+        file_layout.addWidget(btn_ExportMesh, 3, 0)
+        file_layout.addWidget(btn_ExportAnim, 3, 1)
 
         # Tools panel
         grp_Tools = CollapsingGroupBox("Tools", self)
         grp_Tools.setObjectName("grpTools")
+        tools_layout = grp_Tools.inner.layout()
 
         lbl_Materials = QtWidgets.QLabel("PDX materials:", self)
         self.material_create_popup = btn_MaterialCreate = QtWidgets.QPushButton("Create", self)
@@ -328,18 +400,19 @@ class PDX_UI(QtWidgets.QDialog):
         self.mesh_index_popup = btn_MeshOrder = QtWidgets.QPushButton("Set mesh order ...", self)
         set_widget_icon(btn_MeshOrder, "sortName.png")
 
-        grp_Tools.inner.layout().addWidget(lbl_Materials, 0, 0, 1, 2)
-        grp_Tools.inner.layout().addWidget(btn_MaterialCreate, 1, 0)
-        grp_Tools.inner.layout().addWidget(btn_MaterialEdit, 1, 1)
-        grp_Tools.inner.layout().addWidget(lbl_Bones, 2, 0, 1, 2)
-        grp_Tools.inner.layout().addWidget(btn_BoneIgnore, 3, 0)
-        grp_Tools.inner.layout().addWidget(btn_BoneUnignore, 3, 1)
-        grp_Tools.inner.layout().addWidget(lbl_Meshes, 4, 0, 1, 2)
-        grp_Tools.inner.layout().addWidget(btn_MeshOrder, 5, 0, 1, 2)
+        tools_layout.addWidget(lbl_Materials, 0, 0, 1, 2)
+        tools_layout.addWidget(btn_MaterialCreate, 1, 0)
+        tools_layout.addWidget(btn_MaterialEdit, 1, 1)
+        tools_layout.addWidget(lbl_Bones, 2, 0, 1, 2)
+        tools_layout.addWidget(btn_BoneIgnore, 3, 0)
+        tools_layout.addWidget(btn_BoneUnignore, 3, 1)
+        tools_layout.addWidget(lbl_Meshes, 4, 0, 1, 2)
+        tools_layout.addWidget(btn_MeshOrder, 5, 0, 1, 2)
 
         # Display panel
         grp_Display = CollapsingGroupBox("Display", self)
         grp_Display.setObjectName("grpDisplay")
+        display_layout = grp_Display.inner.layout()
 
         lbl_Display = QtWidgets.QLabel("Display local axes:", self)
         self.show_axis_bones = btn_ShowBones = QtWidgets.QPushButton("Show on bones", self)
@@ -351,15 +424,16 @@ class PDX_UI(QtWidgets.QDialog):
         self.hide_axis_locators = btn_HideLocators = QtWidgets.QPushButton("Hide on locators", self)
         set_widget_icon(btn_HideLocators, "out_holder.png")
 
-        grp_Display.inner.layout().addWidget(lbl_Display, 0, 0, 1, 2)
-        grp_Display.inner.layout().addWidget(btn_ShowBones, 1, 0)
-        grp_Display.inner.layout().addWidget(btn_HideBones, 1, 1)
-        grp_Display.inner.layout().addWidget(btn_ShowLocators, 2, 0)
-        grp_Display.inner.layout().addWidget(btn_HideLocators, 2, 1)
+        display_layout.addWidget(lbl_Display, 0, 0, 1, 2)
+        display_layout.addWidget(btn_ShowBones, 1, 0)
+        display_layout.addWidget(btn_HideBones, 1, 1)
+        display_layout.addWidget(btn_ShowLocators, 2, 0)
+        display_layout.addWidget(btn_HideLocators, 2, 1)
 
         # Setup panel
         grp_Setup = CollapsingGroupBox("Setup", self)
         grp_Setup.setObjectName("grpSetup")
+        setup_layout = grp_Setup.inner.layout()
 
         lbl_SetupEngine = QtWidgets.QLabel("Engine:", self)
         self.ddl_EngineSelect = QtWidgets.QComboBox(self)
@@ -367,66 +441,93 @@ class PDX_UI(QtWidgets.QDialog):
         lbl_SetupAnimation = QtWidgets.QLabel("Animation:", self)
         self.spn_AnimationFps = QtWidgets.QDoubleSpinBox(self)
 
-        grp_Setup.inner.layout().addWidget(lbl_SetupEngine, 0, 0)
-        grp_Setup.inner.layout().addWidget(self.ddl_EngineSelect, 0, 1)
-        grp_Setup.inner.layout().addWidget(lbl_SetupAnimation, 1, 0)
-        grp_Setup.inner.layout().addWidget(self.spn_AnimationFps, 1, 1)
-        grp_Setup.inner.layout().setColumnStretch(1, 1)
+        setup_layout.addWidget(lbl_SetupEngine, 0, 0)
+        setup_layout.addWidget(self.ddl_EngineSelect, 0, 1)
+        setup_layout.addWidget(lbl_SetupAnimation, 1, 0)
+        setup_layout.addWidget(self.spn_AnimationFps, 1, 1)
+        setup_layout.setColumnStretch(1, 1)
 
         # Info panel
         grp_Info = CollapsingGroupBox("Info", self)
         grp_Info.setObjectName("grpInfo")
+        info_layout = grp_Info.inner.layout()
 
         lbl_Current = QtWidgets.QLabel("current version: {0}".format(github.CURRENT_VERSION), self)
-        self.update_version, self.about_popup = None, None
-        if github.AT_LATEST is False:  # update info appears if we aren't at the latest tag version
-            self.update_version = btn_UpdateVersion = QtWidgets.QPushButton(
-                "NEW UPDATE {0}".format(github.LATEST_VERSION), self
-            )
-            set_widget_icon(btn_UpdateVersion, "SE_FavoriteStar.png")
-            self.about_popup = btn_AboutVersion = QtWidgets.QPushButton("About", self)
-            set_widget_icon(btn_AboutVersion, "info.png")
 
-        # Help sub panel
-        grp_Help = CollapsingGroupBox("Help", self)
+        # Help sub panel, buttons are only created once the panel is first expanded
+        grp_Help = CollapsingGroupBox("Help", self, populate=self.create_help_controls)
         grp_Help.setObjectName("grpHelp")
+        help_layout = grp_Help.inner.layout()
+        help_layout.setContentsMargins(0, 0, 0, 0)
+        help_layout.setSpacing(4)
 
-        self.help_wiki = btn_HelpWiki = QtWidgets.QPushButton("Tool Wiki", self)
-        set_widget_icon(btn_HelpWiki, "help.png")
-        self.help_forum = btn_HelpForum = QtWidgets.QPushButton("Paradox forums", self)
-        set_widget_icon(btn_HelpForum, "help.png")
-        self.help_source = btn_HelpSource = QtWidgets.QPushButton("Source code", self)
-        set_widget_icon(btn_HelpSource, "help.png")
-
-        grp_Help.inner.layout().addWidget(btn_HelpWiki, 0, 0)
-        grp_Help.inner.layout().addWidget(btn_HelpForum, 1, 0)
-        grp_Help.inner.layout().addWidget(btn_HelpSource, 2, 0)
-        grp_Help.inner.layout().setContentsMargins(0, 0, 0, 0)
-        grp_Help.inner.layout().setSpacing(4)
-
-        grp_Info.inner.layout().addWidget(lbl_Current, 0, 0, 1, 2)
-        if github.AT_LATEST is False:
-            grp_Info.inner.layout().addWidget(btn_UpdateVersion, 1, 0)
-            grp_Info.inner.layout().addWidget(btn_AboutVersion, 1, 1)
-            grp_Info.inner.layout().setColumnStretch(0, 1)
-        grp_Info.inner.layout().addWidget(grp_Help, 3, 0, 1, 2)
-        grp_Info.inner.layout().setRowMinimumHeight(2, 4)
+        info_layout.addWidget(lbl_Current, 0, 0, 1, 2)
+        info_layout.addWidget(grp_Help, 3, 0, 1, 2)
+        info_layout.setRowMinimumHeight(2, 4)
+
+        # update controls go in row 1 of the Info panel, if the update check has already completed
+        self.info_layout = info_layout
+        self.update_version, self.about_popup = None, None
+        self.create_update_controls()
 
         # main layout
-        self.setLayout(QtWidgets.QVBoxLayout())
-        self.layout().setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
-        self.layout().setContentsMargins(4, 4, 4, 4)
-        self.layout().setSpacing(6)
+        main_layout = QtWidgets.QVBoxLayout()
+        self.setLayout(main_layout)
+        main_layout.setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
+        main_layout.setContentsMargins(4, 4, 4, 4)
+        main_layout.setSpacing(6)
         for group_widget in [grp_File, grp_Tools, grp_Display, grp_Setup, grp_Info]:
-            group_widget.inner.layout().setContentsMargins(0, 0, 0, 0)
-            group_widget.inner.layout().setSpacing(4)
-            self.layout().addWidget(group_widget)
+            group_layout = group_widget.inner.layout()
+            group_layout.setContentsMargins(0, 0, 0, 0)
+            group_layout.setSpacing(4)
+            main_layout.addWidget(group_widget)
+
+        main_layout.addStretch()
 
-        self.layout().addStretch()
+        # keep the panels whose expand state is stored in the settings, rather than searching for them each time
+        self.groupboxes = [grp_File, grp_Tools, grp_Display, grp_Setup, grp_Info, grp_Help]
 
         for btn in self.findChildren(QtWidgets.QPushButton):
             btn.setMaximumHeight(22)
 
+    @QtCore.Slot()
+    def create_update_controls(self):
+        # update info appears if we aren't at the latest tag version, None means the version check hasn't completed
+        if github.AT_LATEST is not False or self.update_version is not None:
+            return
+
+        self.update_version = btn_UpdateVersion = QtWidgets.QPushButton(
+            "NEW UPDATE {0}".format(github.LATEST_VERSION), self
+        )
+        set_widget_icon(btn_UpdateVersion, "SE_FavoriteStar.png")
+        self.about_popup = btn_AboutVersion = QtWidgets.QPushButton("About", self)
+        set_widget_icon(btn_AboutVersion, "info.png")
+
+        for btn in [btn_UpdateVersion, btn_AboutVersion]:
+            btn.setMaximumHeight(22)
+        self.info_layout.addWidget(btn_UpdateVersion, 1, 0)
+        self.info_layout.addWidget(btn_AboutVersion, 1, 1)
+        self.info_layout.setColumnStretch(0, 1)
+
+        # connected here rather than in connect_signals, as these buttons may be created after the dialog is shown
+        btn_UpdateVersion.clicked.connect(partial(webbrowser.open, str(github.LATEST_URL)))
+        btn_AboutVersion.clicked.connect(self.show_update_notes)
+
+    def create_help_controls(self, help_layout):
+        self.help_wiki = btn_HelpWiki = QtWidgets.QPushButton("Tool Wiki", self)
+        self.help_forum = btn_HelpForum = QtWidgets.QPushButton("Paradox forums", self)
+        self.help_source = btn_HelpSource = QtWidgets.QPushButton("Source code", self)
+
+        for row, btn in enumerate([btn_HelpWiki, btn_HelpForum, btn_HelpSource]):
+            set_widget_icon(btn, "help.png")
+            btn.setMaximumHeight(22)
+            help_layout.addWidget(btn, row, 0)
+
+        # connected here rather than in connect_signals, as these buttons don't exist until now
+        self.help_wiki.clicked.connect(partial(webbrowser.open, bl_info["wiki_url"]))
+        self.help_forum.clicked.connect(partial(webbrowser.open, bl_info["forum_url"]))
+        self.help_source.clicked.connect(partial(webbrowser.open, bl_info["project_url"]))
+
     def connect_signals(self):
         self.mesh_import.clicked.connect(self.import_mesh)
         self.anim_import.clicked.connect(self.import_anim)
@@ -446,19 +547,15 @@ class PDX_UI(QtWidgets.QDialog):
 
         self.ddl_EngineSelect.currentIndexChanged.connect(self.set_engine)
 
-        if self.update_version:
-            self.update_version.clicked.connect(partial(webbrowser.open, str(github.LATEST_URL)))
-        if self.about_popup:
-            self.about_popup.clicked.connect(self.show_update_notes)
-        self.help_wiki.clicked.connect(partial(webbrowser.open, bl_info["wiki_url"]))
-        self.help_forum.clicked.connect(partial(webbrowser.open, bl_info["forum_url"]))
-        self.help_source.clicked.connect(partial(webbrowser.open, bl_info["project_url"]))
 
     def showEvent(self, event):
         self.read_ui_settings()
         event.accept()
 
     def closeEvent(self, event):
+        # this dialog is deleted on close, so stop the updater signalling it
+        if self.on_update_checked in github.on_checked:
+            github.on_checked.remove(self.on_update_checked)
         self.write_ui_settings()
         if self.popup:
             self.popup.close()
@@ -477,10 +574,16 @@ class PDX_UI(QtWidgets.QDialog):
         else:
             self.restoreGeometry(geom)
 
-        # restore groupbox panels expand state
-        for grp in self.findChildren(QtWidgets.QGroupBox):
+        # restore groupbox panels expand state, without signals so the dialog is only laid out and resized once
+        self.setUpdatesEnabled(False)
+        for grp in self.groupboxes:
             state = bool(self.settings.value("ui/isChecked_{0}".format(grp.objectName()), defaultValue=True))
+            grp.blockSignals(True)
             grp.setChecked(state)
+            grp.blockSignals(False)
+            grp.set_expanded(state)
+        self.setUpdatesEnabled(True)
+        self.resize(self.layout().sizeHint())
 
         # restore engine selection
         self.ddl_EngineSelect.setCurrentText(IO_PDX_SETTINGS.last_set_engine or ENGINE_SETTINGS.keys()[0])
@@ -493,7 +596,7 @@ class PDX_UI(QtWidgets.QDialog):
         self.settings.setValue("ui/geometry", self.saveGeometry())
 
         # store groupbox panels expand state
-        for grp in self.findChildren(QtWidgets.QGroupBox):
+        for grp in self.groupboxes:
             self.settings.setValue("ui/isChecked_{0}".format(grp.objectName()), int(grp.isChecked()))
 
     @QtCore.Slot()
@@ -577,8 +680,11 @@ class PDX_UI(QtWidgets.QDialog):
 
     @QtCore.Slot()
     def show_popup(self, popup_widget):
+        # popups are passed as a class and only built when requested, none of their controls exist until then
         if self.popup:
+            # a closed popup is only hidden, delete it so replaced popups and their connections don't build up
             self.popup.close()
+            self.popup.deleteLater()
         self.popup = popup_widget(parent=self)
         self.popup.show()
 
@@ -592,13 +698,15 @@ class PDX_UI(QtWidgets.QDialog):
     def show_update_notes(self):
         msg_text = github.LATEST_NOTES
 
-        # split text into multiple label rows if it's wider than the panel
-        txt_lines = []
-        for line in msg_text.splitlines():
-            txt_lines.extend(wrap(line, 450 / 6))
-            txt_lines.append("")
+        # split text into multiple label rows if it's wider than the panel, the notes don't change so only do this once
+        if msg_text not in self.wrapped_notes:
+            txt_lines = []
+            for line in msg_text.splitlines():
+                txt_lines.extend(wrap(line, 450 // 6))
+                txt_lines.append("")
+            self.wrapped_notes[msg_text] = "\n".join(txt_lines)
 
-        QtWidgets.QMessageBox.information(self, bl_info["name"], "\n".join(txt_lines))
+        QtWidgets.QMessageBox.information(self, bl_info["name"], self.wrapped_notes[msg_text])
 
 
 class MaterialCreatePopup_UI(QtWidgets.QWidget):
@@ -608,15 +716,10 @@ class MaterialCreatePopup_UI(QtWidgets.QWidget):
         self.setWindowTitle("Create a PDX material")
         self.setWindowFlags(QtCore.Qt.Popup)
         self.setFixedWidth(350)
-        if self.parent:
-            center_x = self.parent.frameGeometry().center().x() - (self.width() / 2)
-            center_y = self.parent.frameGeometry().center().y() - (self.height() / 2)
-            self.setGeometry(center_x, center_y, self.width(), self.height())
-
-        move_dialog_onscreen(self)
 
         self.create_controls()
         self.connect_signals()
+        center_on_parent(self)
 
     def create_controls(self):
         # create controls
@@ -688,21 +791,16 @@ class MaterialEditPopup_UI(QtWidgets.QWidget):
         self.setWindowTitle("Edit a PDX material")
         self.setWindowFlags(QtCore.Qt.Popup)
         self.setFixedWidth(350)
-        if self.parent:
-            center_x = self.parent.frameGeometry().center().x() - (self.width() / 2)
-            center_y = self.parent.frameGeometry().center().y() - (self.height() / 2)
-            self.setGeometry(center_x, center_y, self.width(), self.height())
-
-        move_dialog_onscreen(self)
 
         self.create_controls()
         self.connect_signals()
+        center_on_parent(self)
 
     def create_controls(self):
         # create controls
         lbl_help = QtWidgets.QLabel("Edit a PDX material")
         lbl_selected = QtWidgets.QLabel("Selected material:")
-        self.scene_mats = QtWidgets.QComboBox(self)
+        self.scene_mats = LazyComboBox(lambda: [mat.name() for mat in list_scene_pdx_materials()], self)
         self.scene_mats.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         grp_create = QtWidgets.QGroupBox(self)
         grp_create.setLayout(QtWidgets.QFormLayout())
@@ -736,10 +834,6 @@ class MaterialEditPopup_UI(QtWidgets.QWidget):
         main_layout.addLayout(btn_layout)
         self.setLayout(main_layout)
 
-        # populate data
-        self.scene_mats.addItems([mat.name() for mat in list_scene_pdx_materials()])
-        self.scene_mats.setCurrentIndex(-1)
-
     def connect_signals(self):
         self.scene_mats.currentTextChanged.connect(self.mat_select)
         self.btn_okay.clicked.connect(self.execute)
@@ -776,15 +870,10 @@ class MeshIndexPopup_UI(QtWidgets.QWidget):
         self.setWindowTitle("Set mesh index on PDX meshes")
         self.setWindowFlags(QtCore.Qt.Popup)
         self.setFixedSize(200, 300)
-        if self.parent:
-            center_x = self.parent.frameGeometry().center().x() - (self.width() / 2)
-            center_y = self.parent.frameGeometry().center().y() - (self.height() / 2)
-            self.setGeometry(center_x, center_y, self.width(), self.height())
-
-        move_dialog_onscreen(self)
 
         self.create_controls()
         self.connect_signals()
+        center_on_parent(self)
 
     def create_controls(self):
         # create controls
@@ -809,17 +898,18 @@ class MeshIndexPopup_UI(QtWidgets.QWidget):
         main_layout.addLayout(btn_layout)
         self.setLayout(main_layout)
 
-        # populate list
-        self.list_meshes.clearSelection()
-        self.list_meshes.clear()
-        pdx_scenemeshes = [mesh for mesh in list_scene_pdx_meshes()]
-        pdx_scenemeshes.sort(key=lambda mesh: get_mesh_index(mesh))
+        # populate list, the list widget is new so there is nothing to clear first
+        pdx_scenemeshes = sorted(list_scene_pdx_meshes(), key=get_mesh_index)
 
-        for mesh in pdx_scenemeshes:
-            list_item = QtWidgets.QListWidgetItem()
-            list_item.setText(mesh.name())
-            list_item.setData(QtCore.Qt.UserRole, mesh.longName())
-            self.list_meshes.insertItem(self.list_meshes.count(), list_item)
+        # add all rows in one insert with repaints suspended, so the view only updates once they are all added
+        self.list_meshes.setUpdatesEnabled(False)
+        try:
+            self.list_meshes.addItems([mesh.name() for mesh in pdx_scenemeshes])
+            for row, mesh in enumerate(pdx_scenemeshes):
+                # keep the node itself, so saving doesn't need to look each mesh up by name again
+                self.list_meshes.item(row).setData(QtCore.Qt.UserRole, mesh)
+        finally:
+            self.list_meshes.setUpdatesEnabled(True)
 
     def connect_signals(self):
         self.btn_okay.clicked.connect(self.execute)
@@ -830,7 +920,7 @@ class MeshIndexPopup_UI(QtWidgets.QWidget):
         IO_PDX_LOG.info("Setting mesh index order...")
         for i in xrange(self.list_meshes.count()):
             item = self.list_meshes.item(i)
-            maya_mesh = pmc.PyNode(item.data(QtCore.Qt.UserRole))  # type: pmc.nt.Mesh
+            maya_mesh = item.data(QtCore.Qt.UserRole)  # type: pmc.nt.Mesh
             set_mesh_index(maya_mesh, i)
             IO_PDX_LOG.info("\t{0} - {0}".format(maya_mesh.name(), i))
 
@@ -1018,20 +1108,30 @@ class AnimExport_UI(CustomFileDialog):
 class MayaProgress(object):
     """ Wrapping the Maya progress window for convenience. """
 
+    # progress is tracked here rather than queried back from the window, which is only redrawn every interval
+    refresh_interval = 0.05  # seconds
+    _progress = 0
+    _max_value = 0
+    _last_refresh = 0.0
+
     def __init__(self, title, max_value):
         super(MayaProgress, self).__init__()
+        MayaProgress._progress, MayaProgress._max_value, MayaProgress._last_refresh = 0, max_value, 0.0
         pmc.progressWindow(title=title, progress=0, min=0, max=max_value, status="", isInterruptable=False)
 
     def __del__(self):
         self.finished()
 
-    @staticmethod
-    def update(step, status):
-        progress = pmc.progressWindow(query=True, progress=True)
-        max_value = pmc.progressWindow(query=True, max=True)
-        if progress >= max_value:
-            pmc.progressWindow(edit=True, progress=0)
-        pmc.progressWindow(edit=True, step=step, status=status)
+    @classmethod
+    def update(cls, step, status):
+        if cls._progress >= cls._max_value:
+            cls._progress = 0
+        cls._progress += step
+
+        now = time.time()
+        if now - cls._last_refresh >= cls.refresh_interval or cls._progress >= cls._max_value:
+            pmc.progressWindow(edit=True, progress=cls._progress, status=status)
+            cls._last_refresh = now
 
     @staticmethod
     def finished():
@@ -8,7 +8,19 @@
 import os
 import sys
 import json
+import threading
 import os.path as path
+from contextlib import contextmanager
+
+# Py2, Py3 compatibility (Py2 has no atomic replace, remove the old file first)
+try:
+    from os import replace as replace_file
+except ImportError:
+
+    def replace_file(src, dst):
+        if path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
 
 
 """ ====================================================================================================================
@@ -16,9 +28,24 @@ import os.path as path
 ========================================================================================================================
 """
 
+# distinguishes a setting that has never been assigned from one set to None
+_MISSING = object()
+# settings may be changed and saved from a background thread (the update check), so changes, batches and saves all
+# hold this lock, re-entrant as saves and nested batches happen while it is already held
+_SETTINGS_LOCK = threading.RLock()
+# attributes describing the running session, set on each launch and never saved to the settings file
+_RUNTIME_ATTRS = frozenset(["config_path", "app"])
+
 
 class PDXsettings(object):
     def __init__(self, filepath):
+        # internal state and runtime attributes live on the instance, only the settings dictionary is saved to file
+        object.__setattr__(self, "_settings", {})
+        object.__setattr__(self, "_dirty", False)
+        object.__setattr__(self, "_in_batch", False)
+        object.__setattr__(self, "config_path", filepath)
+        object.__setattr__(self, "app", sys.executable)
+
         if path.exists(filepath):
             # read settings file
             self.load_settings_file(filepath)
@@ -26,30 +53,56 @@ class PDXsettings(object):
             # new settings file
             try:
                 os.makedirs(path.dirname(filepath))
-                with open(filepath, "w") as _:
-                    pass
             except OSError as err:
                 print(err)
-
-        # default settings
-        self.config_path = filepath
-        self.app = sys.executable
+            self.save_settings_file()
 
     def __setattr__(self, name, value):
-        result = super(PDXsettings, self).__setattr__(name, value)
-        self.save_settings_file()
-        return result
+        if name.startswith("_") or name in _RUNTIME_ATTRS:
+            return super(PDXsettings, self).__setattr__(name, value)
+
+        with _SETTINGS_LOCK:
+            current = self._settings.get(name, _MISSING)
+            self._settings[name] = value
+            # assigning the value a setting already has doesn't need the file rewritten
+            if current is _MISSING or current != value:
+                self._dirty = True
+                if not self._in_batch:
+                    self.save_settings_file()
 
     def __getattr__(self, attr):
-        try:
-            return super(PDXsettings, self).__getattr__(attr)
-        except AttributeError:
-            return None
+        # only reached when normal attribute lookup fails, settings which have never been set default to None
+        return self.__dict__.get("_settings", {}).get(attr)
 
     def __delattr__(self, name):
-        result = super(PDXsettings, self).__delattr__(name)
-        self.save_settings_file()
-        return result
+        if name not in self._settings:
+            return super(PDXsettings, self).__delattr__(name)
+
+        with _SETTINGS_LOCK:
+            del self._settings[name]
+            self._dirty = True
+            if not self._in_batch:
+                self.save_settings_file()
+
+    @contextmanager
+    def batch(self):
+        """ Defers saving the settings file until the end of the block, so several settings are written at once. Other
+        threads wait to change settings until the block ends. """
+        with _SETTINGS_LOCK:
+            in_batch = self._in_batch
+            self._in_batch = True
+            try:
+                yield self
+            finally:
+                self._in_batch = in_batch
+                if not in_batch and self._dirty:
+                    self.save_settings_file()
+
+    def update(self, **kwargs):
+        """ Sets several settings at once, the settings file is saved once if any of them changed. """
+        with self.batch():
+            for name, value in kwargs.items():
+                setattr(self, name, value)
 
     def load_settings_file(self, filepath):
         # default to empty settings dictionary
@@ -60,13 +113,21 @@ class PDXsettings(object):
             except Exception as err:
                 print(err)
 
-        self.config_path = filepath
-        for k, v in settings_dict.items():
-            setattr(self, k, v)
+        # these values were just read from the file, so they don't need writing back (older files also stored runtime
+        # attributes, those are skipped)
+        with _SETTINGS_LOCK:
+            self.config_path = filepath
+            self._settings.update((k, v) for k, v in settings_dict.items() if k not in _RUNTIME_ATTRS)
 
     def save_settings_file(self):
-        try:
-            with open(self.config_path, "w") as f:
-                json.dump(self.__dict__, f, sort_keys=True, indent=4)
-        except Exception as err:
-            print(err)
+        with _SETTINGS_LOCK:
+            try:
+                # serialise fully before touching the file, then swap it in so an interrupted save can't truncate it
+                settings_json = json.dumps(self._settings, sort_keys=True, indent=4)
+                temp_path = self.config_path + ".tmp"
+                with open(temp_path, "w") as f:
+                    f.write(settings_json)
+                replace_file(temp_path, self.config_path)
+                self._dirty = False
+            except Exception as err:
+                print(err)
@@ -7,13 +7,14 @@
 
 import json
 import time
+import threading
 from datetime import datetime, date
 
 # Py2, Py3 compatibility
 try:
-    from urllib.request import urlopen, Request, URLError
+    from urllib.request import urlopen, Request, URLError, HTTPError
 except ImportError:
-    from urllib2 import urlopen, Request, URLError
+    from urllib2 import urlopen, Request, URLError, HTTPError
 
 from . import bl_info, IO_PDX_LOG, IO_PDX_SETTINGS
 
@@ -33,6 +34,12 @@ API_URL = "https://api.github.com"
 """
 
 
+def version_tuple(version):
+    """ Splits a version into a tuple of integers, so 0.10 compares as newer than 0.9 (as floats it would be older).
+    Also accepts the float versions cached in older settings files. """
+    return tuple(int(part) for part in str(version).split("."))
+
+
 class Github_API(object):
     """
         Handles connection to Githubs API to get some data on releases for this repository.
@@ -42,7 +49,9 @@ class Github_API(object):
         self.LATEST_VERSION = None
         self.LATEST_URL = None
         self.AT_LATEST = None
-        self.CURRENT_VERSION = float(".".join(map(str, bl_info["version"])))
+        # called with no arguments when a background update check completes, from the thread that ran the check
+        self.on_checked = []
+        self.CURRENT_VERSION = ".".join(map(str, bl_info["version"]))
 
         self.api = API_URL
         self.owner = bl_info["author"]
@@ -51,13 +60,23 @@ class Github_API(object):
         self.refresh()
 
     @staticmethod
-    def get_data(url, t):
+    def get_data(url, t, etag=None):
+        """ Returns the decoded response and its ETag. If an ETag is given and the response is unchanged since then, the
+        server sends no body and the data returned is None. """
         req = Request(url)
-        result = urlopen(req, timeout=t)
+        if etag:
+            req.add_header("If-None-Match", etag)
+        try:
+            result = urlopen(req, timeout=t)
+        except HTTPError as err:
+            if err.code == 304:  # not modified
+                return None, etag
+            raise
         result_str = result.read()
+        etag = result.info().get("ETag")
         result.close()
 
-        return json.JSONDecoder().decode(result_str.decode())
+        return json.JSONDecoder().decode(result_str.decode()), etag
 
     def refresh(self, force=False):
         recheck = True
@@ -68,46 +87,80 @@ class Github_API(object):
             recheck = date.today() > datetime.strptime(last_check_date, "%Y-%m-%d").date()
 
         if recheck or force:
-            start = time.time()
+            # the request can block for up to the timeout, so make it in the background rather than stalling the host
+            # applications UI while it loads, AT_LATEST stays None until the check completes
+            update_thread = threading.Thread(target=self.check_latest_release, name="io_pdx_mesh update check")
+            update_thread.daemon = True
+            update_thread.start()
 
-            # get latest release data
-            releases_url = "{api}/repos/{owner}/{repo}/releases".format(**self.args)
-            try:
-                release_list = self.get_data(releases_url, TIMEOUT)
-            except URLError as err:
-                IO_PDX_LOG.warning("Unable to check for update. ({})".format(err.reason))
-                return
-            except Exception as err:
-                IO_PDX_LOG.error("Failed on check for update. ({})".format(err))
-                return
+        else:
+            # used cached release data in settings
+            self.LATEST_VERSION = IO_PDX_SETTINGS.github_latest_version
+            self.LATEST_URL = IO_PDX_SETTINGS.github_latest_url
+            self.LATEST_NOTES = IO_PDX_SETTINGS.github_latest_notes
+
+            IO_PDX_LOG.info("Skipped update check. (already ran today)")
+
+            self.compare_versions()
+
+    def check_latest_release(self):
+        start = time.time()
+
+        # get latest release data, only sending the cached ETag when there is cached release data to fall back on
+        releases_url = "{api}/repos/{owner}/{repo}/releases".format(**self.args)
+        etag = IO_PDX_SETTINGS.github_etag if IO_PDX_SETTINGS.github_latest_version is not None else None
+        try:
+            release_list, etag = self.get_data(releases_url, TIMEOUT, etag=etag)
+        except URLError as err:
+            IO_PDX_LOG.warning("Unable to check for update. ({})".format(err.reason))
+            return
+        except Exception as err:
+            IO_PDX_LOG.error("Failed on check for update. ({})".format(err))
+            return
+
+        if release_list is None:
+            # releases are unchanged since the last check, use cached release data in settings
+            self.LATEST_VERSION = IO_PDX_SETTINGS.github_latest_version
+            self.LATEST_URL = IO_PDX_SETTINGS.github_latest_url
+            self.LATEST_NOTES = IO_PDX_SETTINGS.github_latest_notes
+            IO_PDX_SETTINGS.last_update_check = str(date.today())
+
+        else:
             self.LATEST_RELEASE = release_list[0]
 
             latest = release_list[0]
 
             # store data
-            self.LATEST_VERSION = float(latest["tag_name"])
+            self.LATEST_VERSION = latest["tag_name"]
             self.LATEST_URL = latest["assets"][0]["browser_download_url"]
             self.LATEST_NOTES = "{0}\r\nRelease version: {1}\r\n{2}".format(
                 latest["published_at"].split("T")[0], latest["tag_name"], latest["body"]
             )
 
-            # cache data to settings
-            IO_PDX_SETTINGS.github_latest_version = self.LATEST_VERSION
-            IO_PDX_SETTINGS.github_latest_url = self.LATEST_URL
-            IO_PDX_SETTINGS.github_latest_notes = self.LATEST_NOTES
+            # cache data to settings, written to file once
+            IO_PDX_SETTINGS.update(
+                github_latest_version=self.LATEST_VERSION,
+                github_latest_url=self.LATEST_URL,
+                github_latest_notes=self.LATEST_NOTES,
+                github_etag=etag,
+                last_update_check=str(date.today()),
+            )
 
-            IO_PDX_SETTINGS.last_update_check = str(date.today())
-            IO_PDX_LOG.info("Checked for update. ({0:.4f} sec)".format(time.time() - start))
+        IO_PDX_LOG.info("Checked for update. ({0:.4f} sec)".format(time.time() - start))
 
-        else:
-            # used cached release data in settings
-            self.LATEST_VERSION = IO_PDX_SETTINGS.github_latest_version
-            self.LATEST_URL = IO_PDX_SETTINGS.github_latest_url
-            self.LATEST_NOTES = IO_PDX_SETTINGS.github_latest_notes
+        # set last, so the UI only sees the update state once the release data is complete
+        self.compare_versions()
 
-            IO_PDX_LOG.info("Skipped update check. (already ran today)")
+        for callback in list(self.on_checked):
+            try:
+                callback()
+            except Exception as err:
+                IO_PDX_LOG.error("Failed notifying update check. ({})".format(err))
 
-        self.AT_LATEST = self.CURRENT_VERSION == self.LATEST_VERSION
+    def compare_versions(self):
+        if self.LATEST_VERSION is not None:
+            # a local version ahead of the latest release (in development) doesn't need updating either
+            self.AT_LATEST = tuple(bl_info["version"]) >= version_tuple(self.LATEST_VERSION)
 
 
 github = Github_API()